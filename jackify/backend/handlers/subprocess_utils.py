@@ -134,4 +134,12 @@ class ProcessManager:
     def read_stdout_char(self):
         if self.proc and self.proc.stdout:
             return self.proc.stdout.read(1)
-        return None 
\ No newline at end of file
+        return None 
+    def read_stdout_chunk(self, size=65536):
+        """Read whatever stdout has available (up to size bytes), blocking only while none is"""
+        if self.proc and self.proc.stdout:
+            stdout = self.proc.stdout
+            # Buffered readers need read1 to avoid waiting for a full size bytes
+            read = getattr(stdout, 'read1', stdout.read)
+            return read(size)
+        return None
@@ -6,12 +6,16 @@ Centralized service for managing Nexus API keys across CLI and GUI frontends
 """
 
 import logging
+import re
 from typing import Optional, Tuple
 from ..handlers.config_handler import ConfigHandler
 
 # Initialize logger
 logger = logging.getLogger(__name__)
 
+# Basic API key format: 10-200 characters with at least one alphanumeric character
+_API_KEY_RE = re.compile(r'(?=.*[^\W_]).{10,200}', re.DOTALL)
+
 
 class APIKeyService:
     """
@@ -172,18 +176,7 @@ class APIKeyService:
         
         # Basic validation: should be alphanumeric string of reasonable length
         # Nexus API keys are typically 32+ characters, alphanumeric with some special chars
-        api_key = api_key.strip()
-        if len(api_key) < 10:  # Too short to be valid
-            return False
-        
-        if len(api_key) > 200:  # Unreasonably long
-            return False
-        
-        # Should contain some alphanumeric characters
-        if not any(c.isalnum() for c in api_key):
-            return False
-        
-        return True
+        return _API_KEY_RE.fullmatch(api_key.strip()) is not None
     
     def get_api_key_display(self, api_key: str, mask_after_chars: int = 4) -> str:
         """
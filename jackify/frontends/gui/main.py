@@ -628,6 +628,8 @@ class SettingsDialog(QDialog):
                 self.logger.debug("Config save verified successfully")
         
         # Refresh cached paths in GUI screens if Jackify directory changed
+        from jackify.shared.paths import invalidate_path_cache
+        invalidate_path_cache()
         self._refresh_gui_paths()
         
         # Check if debug mode changed and prompt for restart
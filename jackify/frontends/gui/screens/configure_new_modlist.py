@@ -1290,17 +1290,10 @@ class ConfigureNewModlistScreen(QWidget):
         if self._workflow_start_time is None:
             return "unknown time"
         
-        elapsed_seconds = time.time() - self._workflow_start_time
-        elapsed_minutes = int(elapsed_seconds // 60)
-        elapsed_seconds_remainder = int(elapsed_seconds % 60)
-        
-        if elapsed_minutes > 0:
-            if elapsed_minutes == 1:
-                return f"{elapsed_minutes} minute {elapsed_seconds_remainder} seconds"
-            else:
-                return f"{elapsed_minutes} minutes {elapsed_seconds_remainder} seconds"
-        else:
-            return f"{elapsed_seconds_remainder} seconds"
+        minutes, seconds = divmod(int(time.time() - self._workflow_start_time), 60)
+        if minutes:
+            return f"{minutes} minute{'s' if minutes != 1 else ''} {seconds} seconds"
+        return f"{seconds} seconds"
 
     def show_next_steps_dialog(self, message):
         dlg = QDialog(self)
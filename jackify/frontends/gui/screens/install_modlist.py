@@ -1,36 +1,153 @@
 """
 InstallModlistScreen for Jackify GUI
 """
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QComboBox, QHBoxLayout, QLineEdit, QPushButton, QGridLayout, QFileDialog, QTextEdit, QSizePolicy, QTabWidget, QDialog, QListWidget, QListWidgetItem, QMessageBox, QProgressDialog, QApplication, QCheckBox, QStyledItemDelegate, QStyle, QTableWidget, QTableWidgetItem, QHeaderView
-from PySide6.QtCore import Qt, QSize, QThread, Signal, QTimer, QProcess, QMetaObject, QUrl
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QComboBox, QHBoxLayout, QLineEdit, QPushButton, QGridLayout, QFileDialog, QTextEdit, QPlainTextEdit, QSizePolicy, QTabWidget, QDialog, QListWidget, QListWidgetItem, QMessageBox, QProgressDialog, QApplication, QCheckBox, QStyledItemDelegate, QStyle, QTableWidget, QTableWidgetItem, QHeaderView
+from PySide6.QtCore import Qt, QSize, QThread, Signal, QTimer, QProcess, QMetaObject, QUrl, QEventLoop
 from PySide6.QtGui import QPixmap, QTextCursor, QColor, QPainter, QFont
 from ..shared_theme import JACKIFY_COLOR_BLUE, DEBUG_BORDERS
-from ..utils import ansi_to_html
 from ..widgets.unsupported_game_dialog import UnsupportedGameDialog
+from ..utils import ansi_html_to_text
+import atexit
 import os
 import subprocess
 import sys
 import threading
+from datetime import datetime
+from pathlib import Path
 from jackify.backend.handlers.shortcut_handler import ShortcutHandler
 from jackify.backend.handlers.wabbajack_parser import WabbajackParser
+from jackify.backend.handlers.logging_handler import LoggingHandler
+from jackify.backend.handlers.path_handler import PathHandler
+from jackify.backend.services.automated_prefix_service import AutomatedPrefixService
+from jackify.backend.services.modlist_service import ModlistService
+from jackify.backend.models.configuration import SystemInfo
+from jackify.backend.models.modlist import ModlistContext
 import traceback
 from jackify.backend.core.modlist_operations import get_jackify_engine_path
 import signal
 import re
+import select
 import time
 from jackify.backend.handlers.subprocess_utils import ProcessManager
 from jackify.backend.handlers.config_handler import ConfigHandler
 from ..dialogs import SuccessDialog
 from jackify.backend.handlers.validation_handler import ValidationHandler
 from jackify.frontends.gui.dialogs.warning_dialog import WarningDialog
-from jackify.frontends.gui.services.message_service import MessageService
+from jackify.frontends.gui.services.message_service import MessageService, SafeMessageBox
+
+# Output batching budget for InstallationThread signal emits
+_EMIT_INTERVAL = 0.05
+_EMIT_MAX_LINES = 64
+
+# Strips ANSI escape sequences from raw engine output
+_ANSI_ESCAPE = re.compile(rb'\x1b\[[0-9;?]*[ -/]*[@-~]')
+
+# Line delimiters in the reader buffer; \r marks an in-place progress update
+_NL_RE = re.compile(rb'[\r\n]')
+
+# How long an install directory safety check result is reused (seconds)
+_DIR_VALIDATION_TTL = 30
+
+# How long a Nexus API key validation result is reused (seconds); failures expire sooner
+_API_VALID_TTL = 60
+_API_INVALID_TTL = 15
+
+# Process monitor filters: Jackify-related tools, excluding the GUI itself
+_PROC_RE = re.compile(r'(?i)(?:jackify-engine|7zz|texconv|wine64?|protontricks)')
+_GUI_RE = re.compile(r'(?i)jackify-gui\.py')
+
+# Jackify dark theme for the Steam shortcut conflict dialog
+_CONFLICT_DIALOG_QSS = """
+    QDialog {
+        background-color: #2b2b2b;
+        color: #ffffff;
+    }
+    QLabel {
+        color: #ffffff;
+        font-size: 14px;
+        padding: 10px 0px;
+    }
+    QLineEdit {
+        background-color: #404040;
+        color: #ffffff;
+        border: 2px solid #555555;
+        border-radius: 4px;
+        padding: 8px;
+        font-size: 14px;
+        selection-background-color: #3fd0ea;
+    }
+    QLineEdit:focus {
+        border-color: #3fd0ea;
+    }
+    QPushButton {
+        background-color: #404040;
+        color: #ffffff;
+        border: 2px solid #555555;
+        border-radius: 4px;
+        padding: 8px 16px;
+        font-size: 14px;
+        min-width: 120px;
+    }
+    QPushButton:hover {
+        background-color: #505050;
+        border-color: #3fd0ea;
+    }
+    QPushButton:pressed {
+        background-color: #303030;
+    }
+"""
 
-def debug_print(message):
-    """Print debug message only if debug mode is enabled"""
-    from jackify.backend.handlers.config_handler import ConfigHandler
-    config_handler = ConfigHandler()
-    if config_handler.get('debug_mode', False):
-        print(message)
+# Manual Proton setup instructions shown when automated prefix creation isn't used
+_MANUAL_STEPS_TEMPLATE = (
+    "<b>Manual Proton Setup Required for <span style='color:#3fd0ea'>{name}</span></b><br>"
+    "After Steam restarts, complete the following steps in Steam:<br>"
+    "1. Locate the '<b>{name}</b>' entry in your Steam Library<br>"
+    "2. Right-click and select 'Properties'<br>"
+    "3. Switch to the 'Compatibility' tab<br>"
+    "4. Check the box labeled 'Force the use of a specific Steam Play compatibility tool'<br>"
+    "5. Select 'Proton - Experimental' from the dropdown menu<br>"
+    "6. Close the Properties window<br>"
+    "7. Launch '<b>{name}</b>' from your Steam Library<br>"
+    "8. Wait for Mod Organizer 2 to fully open<br>"
+    "9. Once Mod Organizer has fully loaded, CLOSE IT completely and return here<br>"
+    "<br>Once you have completed ALL the steps above, click OK to continue."
+    "{extra}"
+)
+
+# Shared ConfigHandler, created on first use rather than at import time
+_config = None
+
+def _get_config():
+    """Return the module's shared ConfigHandler"""
+    global _config
+    if _config is None:
+        _config = ConfigHandler()
+    return _config
+
+def _debug_enabled():
+    """Return True when debug mode is enabled"""
+    # Changing debug mode requires a restart, so the loaded config stays accurate
+    return _get_config().get('debug_mode', False)
+
+def debug_print(message, *args):
+    """Print debug message only if debug mode is enabled
+
+    Any args are %-formatted into message only when it is actually printed.
+    """
+    if _debug_enabled():
+        print(message % args if args else message)
+
+def _normalize_workflow_result(result):
+    """Normalize a run_working_workflow result to (status, extra, appid, last_timestamp)"""
+    if isinstance(result, tuple):
+        if len(result) == 4:
+            return result
+        if len(result) == 3:
+            # Old format without a timestamp (backward compatibility)
+            status, extra, appid = result
+            return status, extra, appid, None
+    # Non-tuple result is just the success flag
+    return result, None, None, None
 
 class ModlistFetchThread(QThread):
     result = Signal(list, str)
@@ -43,9 +160,6 @@ class ModlistFetchThread(QThread):
     def run(self):
         try:
             # Use proper backend service - NOT the misnamed CLI class
-            from jackify.backend.services.modlist_service import ModlistService
-            from jackify.backend.models.configuration import SystemInfo
-            
             # Initialize backend service
             # Detect if we're on Steam Deck
             is_steamdeck = False
@@ -72,6 +186,101 @@ class ModlistFetchThread(QThread):
             self.result.emit([], error_msg)
 
 
+class SteamRestartThread(QThread):
+    """Restart Steam in the background and report the result through a signal"""
+    def __init__(self, finished_signal, parent=None):
+        super().__init__(parent)
+        self.finished_signal = finished_signal
+
+    def run(self):
+        debug_print("DEBUG: SteamRestartThread started - using direct backend service")
+        try:
+            # Own handler, so the GUI thread's ShortcutHandler is never shared across threads
+            shortcut_handler = ShortcutHandler(steamdeck=False)  # TODO: Use proper system info
+            
+            debug_print("DEBUG: About to call secure_steam_restart()")
+            success = shortcut_handler.secure_steam_restart()
+            debug_print("DEBUG: secure_steam_restart() returned: %s", success)
+            
+            out = "Steam restart completed successfully." if success else "Steam restart failed."
+            
+        except Exception as e:
+            debug_print("DEBUG: Exception in SteamRestartThread: %s", e)
+            success = False
+            out = str(e)
+            
+        self.finished_signal.emit(success, out)
+
+
+class ConfigThread(QThread):
+    """Run post-Steam modlist configuration for a context with a known AppID"""
+    progress_update = Signal(str)
+    configuration_complete = Signal(bool, str, str)
+    error_occurred = Signal(str)
+    
+    def __init__(self, context, report_start_failure=False, parent=None):
+        super().__init__(parent)
+        self.context = context
+        # Automated prefix runs treat a failed start as an error; manual steps runs only warn
+        self.report_start_failure = report_start_failure
+        
+    def run(self):
+        try:
+            # Initialize backend service
+            system_info = SystemInfo(is_steamdeck=False)
+            modlist_service = ModlistService(system_info)
+            
+            # Convert context to ModlistContext for service
+            modlist_context = ModlistContext(
+                name=self.context['name'],
+                install_dir=Path(self.context['path']),
+                download_dir=Path(self.context['path']).parent / 'Downloads',  # Default
+                game_type='skyrim',  # Default for now
+                nexus_api_key='',  # Not needed for configuration
+                modlist_value=self.context.get('modlist_value', ''),
+                modlist_source=self.context.get('modlist_source', 'identifier'),
+                resolution=self.context.get('resolution'),  # Pass resolution from GUI
+                skip_confirmation=True,
+                engine_installed=True  # Skip path manipulation for engine workflows
+            )
+            
+            # Add app_id to context
+            if 'appid' in self.context:
+                modlist_context.app_id = self.context['appid']
+            
+            # Define callbacks
+            def progress_callback(message):
+                self.progress_update.emit(message)
+                
+            def completion_callback(success, message, modlist_name):
+                self.configuration_complete.emit(success, message, modlist_name)
+                
+            def manual_steps_callback(modlist_name, retry_count):
+                # This shouldn't happen since the prefix is already set up
+                self.progress_update.emit(f"Unexpected manual steps callback for {modlist_name}")
+            
+            # Call the service method for post-Steam configuration
+            result = modlist_service.configure_modlist_post_steam(
+                context=modlist_context,
+                progress_callback=progress_callback,
+                manual_steps_callback=manual_steps_callback,
+                completion_callback=completion_callback
+            )
+            
+            if not result:
+                if self.report_start_failure:
+                    self.progress_update.emit("Configuration failed to start")
+                    self.error_occurred.emit("Configuration failed to start")
+                else:
+                    self.progress_update.emit("WARNING: configure_modlist_post_steam returned False")
+            
+        except Exception as e:
+            if not self.report_start_failure:
+                error_details = f"Error in configuration: {e}\nTraceback: {traceback.format_exc()}"
+                self.progress_update.emit(f"DEBUG: {error_details}")
+            self.error_occurred.emit(str(e))
+
+
 class SelectionDialog(QDialog):
     def __init__(self, title, items, parent=None, show_search=True, placeholder_text="Search modlists...", show_legend=False):
         super().__init__(parent)
@@ -347,6 +556,10 @@ class SelectionDialog(QDialog):
 
 class InstallModlistScreen(QWidget):
     steam_restart_finished = Signal(bool, str)
+    # Save checkbox styles used for API key feedback (green for success, red for error)
+    _FEEDBACK_OK_STYLE = "QCheckBox { color: #22c55e; font-weight: bold; }"
+    _FEEDBACK_ERR_STYLE = "QCheckBox { color: #ef4444; font-weight: bold; }"
+
     def __init__(self, stacked_widget=None, main_menu_index=0):
         super().__init__()
         self.stacked_widget = stacked_widget
@@ -355,6 +568,20 @@ class InstallModlistScreen(QWidget):
         self.online_modlists = {}  # {game_type: [modlist_dict, ...]}
         self.modlist_details = {}  # {modlist_name: modlist_dict}
 
+        # Workflow log is written through one persistent buffered handle
+        self._log_fp = None
+        self._log_lock = threading.Lock()
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.timeout.connect(self._flush_log_file)
+        atexit.register(self._close_log_file)
+
+        # Console lines are buffered and appended in one batch every 50 ms
+        self._console_buffer = []
+        self._console_flush_timer = QTimer(self)
+        self._console_flush_timer.setSingleShot(True)
+        self._console_flush_timer.timeout.connect(self._flush_console)
+
         # Initialize log path (can be refreshed via refresh_paths method)
         self.refresh_paths()
 
@@ -367,6 +594,18 @@ class InstallModlistScreen(QWidget):
         self.resolution_service = ResolutionService()
         self.config_handler = ConfigHandler()
         self.protontricks_service = ProtontricksDetectionService()
+        self._validation_handler = ValidationHandler()
+        self._shortcut_handler = None
+        self._path_handler = None
+        self._install_dir = None
+        self._mo2_exe_path = None
+        self._proton_cache = {}  # {appid: validated Proton version}
+        self._workflow_defaults = {}  # Set when the automated prefix workflow starts
+        self.config_thread = None  # ConfigThread of the current configuration run
+        self.steam_restart_thread = None
+        self._current_modlist_name = None  # Shortcut name used by the current workflow
+        # {install_dir: (expiry, mtime, is_safe, reason)}
+        self._dir_validation_cache = {}
         
         # Somnium guidance tracking
         self._show_somnium_guidance = False
@@ -375,6 +614,7 @@ class InstallModlistScreen(QWidget):
         # Scroll tracking for professional auto-scroll behavior
         self._user_manually_scrolled = False
         self._was_at_bottom = True
+        self._scroll_pending = False
         
         # Initialize Wabbajack parser for game detection
         self.wabbajack_parser = WabbajackParser()
@@ -516,8 +756,11 @@ class InstallModlistScreen(QWidget):
         self.api_key_obfuscation_timer.timeout.connect(self._obfuscate_api_key)
         self.api_key_original_text = ""
         self.api_key_is_obfuscated = False
+        self._cached_actual_api_key = None
+        self._api_validation_cache = None  # (api_key, is_valid, message, expiry)
         # Connect events for obfuscation
         self.api_key_edit.textChanged.connect(self._on_api_key_text_changed)
+        self.api_key_edit.textChanged.connect(self._invalidate_api_key_cache)
         self.api_key_edit.focusInEvent = self._on_api_key_focus_in
         self.api_key_edit.focusOutEvent = self._on_api_key_focus_out
         # Load saved API key if available
@@ -535,6 +778,11 @@ class InstallModlistScreen(QWidget):
         self.save_api_key_checkbox = QCheckBox("Save API Key")
         self.save_api_key_checkbox.setChecked(self.api_key_service.has_saved_api_key())
         self.save_api_key_checkbox.toggled.connect(self._on_api_key_save_toggled)
+        # Single reusable timer that restores the checkbox after API key feedback
+        self._feedback_original_style = self.save_api_key_checkbox.styleSheet()
+        self._feedback_timer = QTimer(self)
+        self._feedback_timer.setSingleShot(True)
+        self._feedback_timer.timeout.connect(self._reset_feedback)
         api_save_layout.addWidget(self.save_api_key_checkbox, alignment=Qt.AlignTop)
         
         # Validate button removed - validation now happens silently on save checkbox toggle
@@ -596,7 +844,7 @@ class InstallModlistScreen(QWidget):
             combo_items = [self.resolution_combo.itemText(i) for i in range(self.resolution_combo.count())]
             resolution_index = self.resolution_service.get_resolution_index(saved_resolution, combo_items)
             self.resolution_combo.setCurrentIndex(resolution_index)
-            debug_print(f"DEBUG: Loaded saved resolution: {saved_resolution} (index: {resolution_index})")
+            debug_print("DEBUG: Loaded saved resolution: %s (index: %s)", saved_resolution, resolution_index)
         elif is_steam_deck:
             # Set default to 1280x800 (Steam Deck)
             combo_items = [self.resolution_combo.itemText(i) for i in range(self.resolution_combo.count())]
@@ -697,12 +945,16 @@ class InstallModlistScreen(QWidget):
         main_overall_vbox.addWidget(upper_section_widget)
         # Remove spacing - console should expand to fill available space
         # --- Console output area (full width, placeholder for now) ---
-        self.console = QTextEdit()
+        self.console = QPlainTextEdit()
         self.console.setReadOnly(True)
         self.console.setTextInteractionFlags(Qt.TextSelectableByMouse | Qt.TextSelectableByKeyboard)
         self.console.setMinimumHeight(50)   # Very small minimum - can shrink to almost nothing
         self.console.setMaximumHeight(1000) # Allow growth when space available
-        self.console.setFontFamily('monospace')
+        self.console.setFont(QFont('monospace'))
+        # Plain text keeps appends cheap; old lines are dropped past the block cap
+        self.console.setMaximumBlockCount(5000)
+        self.console.setUndoRedoEnabled(False)
+        self.console.setLineWrapMode(QPlainTextEdit.NoWrap)
         if self.debug:
             self.console.setStyleSheet("border: 2px solid yellow;")
             self.console.setToolTip("CONSOLE")
@@ -733,6 +985,7 @@ class InstallModlistScreen(QWidget):
         self.log_timer = None
         self.last_log_pos = 0
         # --- Process Monitor Timer ---
+        self._last_top_hash = None
         self.top_timer = QTimer(self)
         self.top_timer.timeout.connect(self.update_top_panel)
         self.top_timer.start(2000)
@@ -793,6 +1046,8 @@ class InstallModlistScreen(QWidget):
     def refresh_paths(self):
         """Refresh cached paths when config changes."""
         from jackify.shared.paths import get_jackify_logs_dir
+        # The log location may have changed, reopen on next write
+        self._close_log_file()
         self.modlist_log_path = get_jackify_logs_dir() / 'Modlist_Install_workflow.log'
         os.makedirs(os.path.dirname(self.modlist_log_path), exist_ok=True)
 
@@ -821,6 +1076,7 @@ class InstallModlistScreen(QWidget):
         super().showEvent(event)
         # Always reload saved API key to pick up changes from Settings dialog
         saved_key = self.api_key_service.get_saved_api_key()
+        self._invalidate_api_key_cache()
         if saved_key:
             self.api_key_original_text = saved_key
             self.api_key_edit.setText(saved_key)
@@ -850,17 +1106,17 @@ class InstallModlistScreen(QWidget):
             if saved_install_parent:
                 suggested_install_dir = os.path.join(saved_install_parent, modlist_name)
                 self.install_dir_edit.setText(suggested_install_dir)
-                debug_print(f"DEBUG: Updated install directory suggestion: {suggested_install_dir}")
+                debug_print("DEBUG: Updated install directory suggestion: %s", suggested_install_dir)
             
             # Update download directory suggestion
             saved_download_parent = self.config_handler.get_default_download_parent_dir()
             if saved_download_parent:
                 suggested_download_dir = os.path.join(saved_download_parent, "Downloads")
                 self.downloads_dir_edit.setText(suggested_download_dir)
-                debug_print(f"DEBUG: Updated download directory suggestion: {suggested_download_dir}")
+                debug_print("DEBUG: Updated download directory suggestion: %s", suggested_download_dir)
                 
         except Exception as e:
-            debug_print(f"DEBUG: Error updating directory suggestions: {e}")
+            debug_print("DEBUG: Error updating directory suggestions: %s", e)
     
     def _save_parent_directories(self, install_dir, downloads_dir):
         """Removed automatic saving - user should set defaults in settings"""
@@ -911,11 +1167,32 @@ class InstallModlistScreen(QWidget):
             self.api_key_edit.blockSignals(False)
     
     def _get_actual_api_key(self):
-        """Get the actual API key value (not the obfuscated version)"""
-        if self.api_key_is_obfuscated:
-            return self.api_key_original_text
-        else:
-            return self.api_key_edit.text()
+        """Get the actual API key value (not the obfuscated version), stripped of whitespace"""
+        # Obfuscating/de-obfuscating swaps the displayed text but not the key itself,
+        # so the value only needs recomputing after a real edit
+        if self._cached_actual_api_key is None:
+            if self.api_key_is_obfuscated:
+                key = self.api_key_original_text
+            else:
+                key = self.api_key_edit.text()
+            self._cached_actual_api_key = key.strip()
+        return self._cached_actual_api_key
+
+    def _invalidate_api_key_cache(self, *args):
+        """Drop the cached API key and its validation result after the field is edited"""
+        self._cached_actual_api_key = None
+        self._api_validation_cache = None
+
+    def _validate_api_key_cached(self, api_key):
+        """Validate the API key against Nexus, reusing a recent result for the same key"""
+        now = time.monotonic()
+        cached = self._api_validation_cache
+        if cached and cached[0] == api_key and cached[3] > now:
+            return cached[1], cached[2]
+        is_valid, message = self.api_key_service.validate_api_key_works(api_key)
+        ttl = _API_VALID_TTL if is_valid else _API_INVALID_TTL
+        self._api_validation_cache = (api_key, is_valid, message, now + ttl)
+        return is_valid, message
 
     def open_game_type_dialog(self):
         dlg = SelectionDialog("Select Game Type", self.game_types, self, show_search=False)
@@ -1021,8 +1298,6 @@ class InstallModlistScreen(QWidget):
             self.modlist_btn.setText(modlist_id)
             # Fetch and store the full ModlistInfo for unsupported game detection
             try:
-                from jackify.backend.services.modlist_service import ModlistService
-                from jackify.backend.models.configuration import SystemInfo
                 is_steamdeck = False
                 if os.path.exists('/etc/os-release'):
                     with open('/etc/os-release') as f:
@@ -1069,12 +1344,7 @@ class InstallModlistScreen(QWidget):
             filtered = [header]
             process_rows = []
             for line in lines[1:]:
-                line_lower = line.lower()
-                if (
-                    ("jackify-engine" in line_lower or "7zz" in line_lower or "texconv" in line_lower or
-                     "wine" in line_lower or "wine64" in line_lower or "protontricks" in line_lower)
-                    and "jackify-gui.py" not in line_lower
-                ):
+                if _PROC_RE.search(line) and not _GUI_RE.search(line):
                     cols = line.strip().split(None, 3)
                     if len(cols) >= 3:
                         process_rows.append(cols)
@@ -1083,9 +1353,21 @@ class InstallModlistScreen(QWidget):
                 filtered.append('\t'.join(cols))
             if len(filtered) == 1:
                 filtered.append("[No Jackify-related processes found]")
-            self.process_monitor.setPlainText('\n'.join(filtered))
+            self._set_process_monitor_text('\n'.join(filtered))
         except Exception as e:
-            self.process_monitor.setPlainText(f"[process info unavailable: {e}]")
+            self._set_process_monitor_text(f"[process info unavailable: {e}]")
+
+    def _set_process_monitor_text(self, text):
+        """Update the process monitor only when its content actually changed"""
+        text_hash = hash(text)
+        if text_hash != self._last_top_hash:
+            self.process_monitor.setPlainText(text)
+            self._last_top_hash = text_hash
+
+    def _clear_process_monitor(self):
+        """Clear the process monitor and forget the last shown content"""
+        self.process_monitor.clear()
+        self._last_top_hash = None
 
     def _check_protontricks(self):
         """Check if protontricks is available before critical operations"""
@@ -1119,13 +1401,12 @@ class InstallModlistScreen(QWidget):
         try:
             if checked:
                 # Save API key if one is entered
-                api_key = self._get_actual_api_key().strip()
+                api_key = self._get_actual_api_key()
                 if api_key:
                     # Silently validate API key first
-                    is_valid, validation_message = self.api_key_service.validate_api_key_works(api_key)
+                    is_valid, validation_message = self._validate_api_key_cached(api_key)
                     if not is_valid:
                         # Show error dialog for invalid API key
-                        from jackify.frontends.gui.services.message_service import MessageService
                         MessageService.critical(
                             self, 
                             "Invalid API Key", 
@@ -1162,30 +1443,60 @@ class InstallModlistScreen(QWidget):
         except Exception as e:
             self._show_api_key_feedback(f"✗ Error: {str(e)}", is_success=False)
             self.save_api_key_checkbox.setChecked(False)
-            debug_print(f"DEBUG: Error in _on_api_key_save_toggled: {e}")
+            debug_print("DEBUG: Error in _on_api_key_save_toggled: %s", e)
     
     def _show_api_key_feedback(self, message, is_success=True):
         """Show temporary feedback message for API key operations"""
         # Use tooltip for immediate feedback
-        color = "#22c55e" if is_success else "#ef4444"  # Green for success, red for error
         self.save_api_key_checkbox.setToolTip(message)
         
         # Temporarily change checkbox style to show feedback
-        original_style = self.save_api_key_checkbox.styleSheet()
-        feedback_style = f"QCheckBox {{ color: {color}; font-weight: bold; }}"
-        self.save_api_key_checkbox.setStyleSheet(feedback_style)
-        
-        # Reset style and tooltip after 3 seconds
-        from PySide6.QtCore import QTimer
-        def reset_feedback():
-            self.save_api_key_checkbox.setStyleSheet(original_style)
-            self.save_api_key_checkbox.setToolTip("")
+        self.save_api_key_checkbox.setStyleSheet(
+            self._FEEDBACK_OK_STYLE if is_success else self._FEEDBACK_ERR_STYLE
+        )
         
-        QTimer.singleShot(3000, reset_feedback)
+        # Reset style and tooltip after 3 seconds; restarting extends the current feedback
+        self._feedback_timer.start(3000)
+
+    def _reset_feedback(self):
+        """Restore the save checkbox style and tooltip after API key feedback"""
+        self.save_api_key_checkbox.setStyleSheet(self._feedback_original_style)
+        self.save_api_key_checkbox.setToolTip("")
     
 
+    def _check_install_dir_safety(self, install_dir):
+        """Check install_dir safety, reusing a recent result while the directory is unchanged"""
+        try:
+            mtime = os.stat(install_dir).st_mtime
+        except OSError:
+            mtime = None
+        now = time.monotonic()
+        cached = self._dir_validation_cache.get(install_dir)
+        if cached and cached[0] > now and cached[1] == mtime:
+            return cached[2], cached[3]
+        is_safe, reason = self._validation_handler.is_safe_install_directory(Path(install_dir))
+        self._dir_validation_cache[install_dir] = (now + _DIR_VALIDATION_TTL, mtime, is_safe, reason)
+        return is_safe, reason
+
+    def _ensure_dir(self, path, label):
+        """Offer to create a missing directory. Returns True if it exists afterwards."""
+        dir_path = Path(path)
+        if dir_path.is_dir():
+            return True
+        create = MessageService.question(self, "Create Directory?",
+            f"The {label} directory does not exist:\n{path}\n\nWould you like to create it?",
+            critical=False  # Non-critical, won't steal focus
+        )
+        if create != QMessageBox.Yes:
+            return False
+        try:
+            dir_path.mkdir(parents=True, exist_ok=True)
+        except Exception as e:
+            MessageService.critical(self, "Error", f"Failed to create {label} directory:\n{e}")
+            return False
+        return True
+
     def validate_and_start_install(self):
-        import time
         self._install_workflow_start_time = time.time()
         debug_print('DEBUG: validate_and_start_install called')
         
@@ -1218,12 +1529,12 @@ class InstallModlistScreen(QWidget):
                     machine_url = self.selected_modlist_info.get('machine_url')
                     if machine_url:
                         modlist = machine_url  # Use machine URL for installation
-                        debug_print(f"DEBUG: Using machine_url for installation: {machine_url}")
+                        debug_print("DEBUG: Using machine_url for installation: %s", machine_url)
                     else:
                         debug_print("DEBUG: No machine_url found in selected_modlist_info, using display name")
             install_dir = self.install_dir_edit.text().strip()
             downloads_dir = self.downloads_dir_edit.text().strip()
-            api_key = self._get_actual_api_key().strip()
+            api_key = self._get_actual_api_key()
             modlist_name = self.modlist_name_edit.text().strip()
             missing_fields = []
             if not modlist_name:
@@ -1238,39 +1549,15 @@ class InstallModlistScreen(QWidget):
                 MessageService.warning(self, "Missing Required Fields", f"Please fill in all required fields before starting the install:\n- " + "\n- ".join(missing_fields))
                 self._enable_controls_after_operation()
                 return
-            validation_handler = ValidationHandler()
-            from pathlib import Path
-            is_safe, reason = validation_handler.is_safe_install_directory(Path(install_dir))
+            is_safe, reason = self._check_install_dir_safety(install_dir)
             if not is_safe:
                 dlg = WarningDialog(reason, parent=self)
                 if not dlg.exec() or not dlg.confirmed:
                     return
-            if not os.path.isdir(install_dir):
-                create = MessageService.question(self, "Create Directory?",
-                    f"The install directory does not exist:\n{install_dir}\n\nWould you like to create it?",
-                    critical=False  # Non-critical, won't steal focus
-                )
-                if create == QMessageBox.Yes:
-                    try:
-                        os.makedirs(install_dir, exist_ok=True)
-                    except Exception as e:
-                        MessageService.critical(self, "Error", f"Failed to create install directory:\n{e}")
-                        return
-                else:
-                    return
-            if not os.path.isdir(downloads_dir):
-                create = MessageService.question(self, "Create Directory?",
-                    f"The downloads directory does not exist:\n{downloads_dir}\n\nWould you like to create it?",
-                    critical=False  # Non-critical, won't steal focus
-                )
-                if create == QMessageBox.Yes:
-                    try:
-                        os.makedirs(downloads_dir, exist_ok=True)
-                    except Exception as e:
-                        MessageService.critical(self, "Error", f"Failed to create downloads directory:\n{e}")
-                        return
-                else:
-                    return
+            if not self._ensure_dir(install_dir, "install"):
+                return
+            if not self._ensure_dir(downloads_dir, "downloads"):
+                return
             # Handle API key saving BEFORE validation (to match settings dialog behavior)
             if self.save_api_key_checkbox.isChecked():
                 if api_key:
@@ -1295,7 +1582,7 @@ class InstallModlistScreen(QWidget):
             if resolution and resolution != "Leave unchanged":
                 success = self.resolution_service.save_resolution(resolution)
                 if success:
-                    debug_print(f"DEBUG: Resolution saved successfully: {resolution}")
+                    debug_print("DEBUG: Resolution saved successfully: %s", resolution)
                 else:
                     debug_print("DEBUG: Failed to save resolution")
             else:
@@ -1313,7 +1600,6 @@ class InstallModlistScreen(QWidget):
             
             if install_mode == 'file':
                 # Parse .wabbajack file to get game type
-                from pathlib import Path
                 wabbajack_path = Path(modlist)
                 result = self.wabbajack_parser.parse_wabbajack_game_type(wabbajack_path)
                 if result:
@@ -1349,7 +1635,7 @@ class InstallModlistScreen(QWidget):
                 # For online modlists, try to get game type from selected modlist
                 if hasattr(self, 'selected_modlist_info') and self.selected_modlist_info:
                     game_name = self.selected_modlist_info.get('game', '')
-                    debug_print(f"DEBUG: Detected game_name from selected_modlist_info: '{game_name}'")
+                    debug_print("DEBUG: Detected game_name from selected_modlist_info: '%s'", game_name)
                     
                     # Map game name to game type
                     game_mapping = {
@@ -1364,12 +1650,12 @@ class InstallModlistScreen(QWidget):
                         'enderal special edition': 'enderal'
                     }
                     game_type = game_mapping.get(game_name.lower())
-                    debug_print(f"DEBUG: Mapped game_name '{game_name}' to game_type: '{game_type}'")
+                    debug_print("DEBUG: Mapped game_name '%s' to game_type: '%s'", game_name, game_type)
                     if not game_type:
                         game_type = 'unknown'
-                        debug_print(f"DEBUG: Game type not found in mapping, setting to 'unknown'")
+                        debug_print("DEBUG: Game type not found in mapping, setting to 'unknown'")
                 else:
-                    debug_print(f"DEBUG: No selected_modlist_info found")
+                    debug_print("DEBUG: No selected_modlist_info found")
                     game_type = 'unknown'
             
             # Store game type and name for later use
@@ -1377,50 +1663,50 @@ class InstallModlistScreen(QWidget):
             self._current_game_name = game_name
             
             # Check if game is supported
-            debug_print(f"DEBUG: Checking if game_type '{game_type}' is supported")
-            debug_print(f"DEBUG: game_type='{game_type}', game_name='{game_name}'")
+            debug_print("DEBUG: Checking if game_type '%s' is supported", game_type)
+            debug_print("DEBUG: game_type='%s', game_name='%s'", game_type, game_name)
             is_supported = self.wabbajack_parser.is_supported_game(game_type) if game_type else False
-            debug_print(f"DEBUG: is_supported_game('{game_type}') returned: {is_supported}")
+            debug_print("DEBUG: is_supported_game('%s') returned: %s", game_type, is_supported)
             
             if game_type and not is_supported:
-                debug_print(f"DEBUG: Game '{game_type}' is not supported, showing dialog")
+                debug_print("DEBUG: Game '%s' is not supported, showing dialog", game_type)
                 # Show unsupported game dialog
                 dialog = UnsupportedGameDialog(self, game_name)
                 if not dialog.show_dialog(self, game_name):
                     # User cancelled
                     return
             
-            self.console.clear()
-            self.process_monitor.clear()
+            self._clear_console()
+            self._clear_process_monitor()
             
             # Update button states for installation
             self.start_btn.setEnabled(False)
             self.cancel_btn.setVisible(False)
             self.cancel_install_btn.setVisible(True)
             
-            debug_print(f'DEBUG: Calling run_modlist_installer with modlist={modlist}, install_dir={install_dir}, downloads_dir={downloads_dir}, api_key={api_key[:6]}..., install_mode={install_mode}')
+            debug_print('DEBUG: Calling run_modlist_installer with modlist=%s, install_dir=%s, downloads_dir=%s, api_key=%s..., install_mode=%s', modlist, install_dir, downloads_dir, api_key[:6], install_mode)
             self.run_modlist_installer(modlist, install_dir, downloads_dir, api_key, install_mode)
         except Exception as e:
-            debug_print(f"DEBUG: Exception in validate_and_start_install: {e}")
-            import traceback
-            debug_print(f"DEBUG: Traceback: {traceback.format_exc()}")
+            debug_print("DEBUG: Exception in validate_and_start_install: %s", e)
+            if _debug_enabled():
+                debug_print("DEBUG: Traceback: %s", traceback.format_exc())
             # Re-enable all controls after exception
             self._enable_controls_after_operation()
             self.cancel_btn.setVisible(True)
             self.cancel_install_btn.setVisible(False)
-            debug_print(f"DEBUG: Controls re-enabled in exception handler")
+            debug_print("DEBUG: Controls re-enabled in exception handler")
 
     def run_modlist_installer(self, modlist, install_dir, downloads_dir, api_key, install_mode='online'):
         debug_print('DEBUG: run_modlist_installer called - USING THREADED BACKEND WRAPPER')
         
         # Rotate log file at start of each workflow run (keep 5 backups)
-        from jackify.backend.handlers.logging_handler import LoggingHandler
-        from pathlib import Path
         log_handler = LoggingHandler()
+        # Release the handle so the rotated file is not written to afterwards
+        self._close_log_file()
         log_handler.rotate_log_file_per_run(Path(self.modlist_log_path), backup_count=5)
         
         # Clear console for fresh installation output
-        self.console.clear()
+        self._clear_console()
         self._safe_append_text("Starting modlist installation with custom progress handling...")
         
         # Update UI state for installation
@@ -1429,11 +1715,9 @@ class InstallModlistScreen(QWidget):
         self.cancel_install_btn.setVisible(True)
         
         # Create installation thread
-        from PySide6.QtCore import QThread, Signal
-        
         class InstallationThread(QThread):
-            output_received = Signal(str)
-            progress_received = Signal(str)
+            output_received = Signal(list)
+            progress_received = Signal(list)
             installation_finished = Signal(bool, str)
             
             def __init__(self, modlist, install_dir, downloads_dir, api_key, modlist_name, install_mode='online'):
@@ -1446,12 +1730,58 @@ class InstallModlistScreen(QWidget):
                 self.install_mode = install_mode
                 self.cancelled = False
                 self.process_manager = None
+                # Lines are batched and emitted at most every _EMIT_INTERVAL seconds
+                # or _EMIT_MAX_LINES lines to avoid one GUI update per output line
+                self._out_batch = []
+                self._prog_batch = []
+                self._last_emit = time.monotonic()
             
             def cancel(self):
                 self.cancelled = True
                 if self.process_manager:
                     self.process_manager.cancel()
             
+            def _stdout_pending(self):
+                """Return True if more engine output can be read without blocking"""
+                try:
+                    return bool(select.select([self.process_manager.proc.stdout], [], [], 0)[0])
+                except Exception:
+                    return False
+            
+            def _flush_output(self):
+                if self._out_batch:
+                    # Hand the list over and start a new one - the queued slot still references it
+                    self.output_received.emit(self._out_batch)
+                    self._out_batch = []
+                self._last_emit = time.monotonic()
+            
+            def _flush_progress(self):
+                if self._prog_batch:
+                    self.progress_received.emit(self._prog_batch)
+                    self._prog_batch = []
+                self._last_emit = time.monotonic()
+            
+            def _should_flush(self, batch):
+                # Flush on time/count budget; lines left over when the engine goes
+                # quiet are flushed once per read chunk in run()
+                return (time.monotonic() - self._last_emit > _EMIT_INTERVAL
+                        or len(batch) >= _EMIT_MAX_LINES)
+            
+            def _queue_output(self, line):
+                # Keep output and progress ordered relative to each other
+                if self._prog_batch:
+                    self._flush_progress()
+                self._out_batch.append(line)
+                if self._should_flush(self._out_batch):
+                    self._flush_output()
+            
+            def _queue_progress(self, line):
+                if self._out_batch:
+                    self._flush_output()
+                self._prog_batch.append(line)
+                if self._should_flush(self._prog_batch):
+                    self._flush_progress()
+            
             def run(self):
                 try:
                     engine_path = get_jackify_engine_path()
@@ -1461,48 +1791,60 @@ class InstallModlistScreen(QWidget):
                         cmd = [engine_path, "install", "-m", self.modlist, "-o", self.install_dir, "-d", self.downloads_dir]
                     
                     # Check for debug mode and add --debug flag
-                    from jackify.backend.handlers.config_handler import ConfigHandler
-                    config_handler = ConfigHandler()
-                    debug_mode = config_handler.get('debug_mode', False)
+                    debug_mode = _debug_enabled()
                     if debug_mode:
                         cmd.append('--debug')
                         debug_print("DEBUG: Added --debug flag to jackify-engine command")
                     env = os.environ.copy()
                     env['NEXUS_API_KEY'] = self.api_key
                     self.process_manager = ProcessManager(cmd, env=env, text=False)
-                    ansi_escape = re.compile(rb'\x1b\[[0-9;?]*[ -/]*[@-~]')
+                    # Bind hot-loop lookups to locals once
+                    read = self.process_manager.read_stdout_chunk
+                    queue_prog = self._queue_progress
+                    queue_out = self._queue_output
+                    # Only lines that contain an ESC byte go through the regex
+                    sub = _ANSI_ESCAPE.sub
+                    finditer = _NL_RE.finditer
                     buffer = b''
                     last_was_blank = False
                     while True:
+                        # cancelled is set from the GUI thread, so it is re-read every pass
                         if self.cancelled:
                             self.cancel()
                             break
-                        char = self.process_manager.read_stdout_char()
-                        if not char:
+                        chunk = read()
+                        if not chunk:
                             break
-                        buffer += char
-                        while b'\n' in buffer or b'\r' in buffer:
-                            if b'\r' in buffer and (buffer.index(b'\r') < buffer.index(b'\n') if b'\n' in buffer else True):
-                                line, buffer = buffer.split(b'\r', 1)
-                                line = ansi_escape.sub(b'', line)
-                                decoded = line.decode('utf-8', errors='replace')
-                                self.progress_received.emit(decoded)
-                            elif b'\n' in buffer:
-                                line, buffer = buffer.split(b'\n', 1)
-                                line = ansi_escape.sub(b'', line)
-                                decoded = line.decode('utf-8', errors='replace')
-                                # Collapse multiple blank lines to one
-                                if decoded.strip() == '':
-                                    if not last_was_blank:
-                                        self.output_received.emit('')
-                                    last_was_blank = True
-                                else:
-                                    self.output_received.emit(decoded)
-                                    last_was_blank = False
+                        buffer += chunk
+                        pos = 0
+                        for m in finditer(buffer):
+                            start = m.start()
+                            line, delim, pos = buffer[pos:start], buffer[start:start + 1], start + 1
+                            if b'\x1b' in line:
+                                line = sub(b'', line)
+                            decoded = line.decode('utf-8', errors='replace')
+                            if delim == b'\r':
+                                queue_prog(decoded)
+                            # Collapse multiple blank lines to one
+                            elif decoded.strip() == '':
+                                if not last_was_blank:
+                                    queue_out('')
+                                last_was_blank = True
+                            else:
+                                queue_out(decoded)
+                                last_was_blank = False
+                        # Keep only the unterminated tail for the next chunk
+                        buffer = buffer[pos:]
+                        # Engine has gone quiet - don't hold the last lines back until it writes again
+                        if not self._stdout_pending():
+                            self._flush_progress()
+                            self._flush_output()
                     if buffer:
-                        line = ansi_escape.sub(b'', buffer)
+                        line = sub(b'', buffer) if b'\x1b' in buffer else buffer
                         decoded = line.decode('utf-8', errors='replace')
-                        self.output_received.emit(decoded)
+                        self._out_batch.append(decoded)
+                    self._flush_progress()
+                    self._flush_output()
                     self.process_manager.wait()
                     if self.cancelled:
                         self.installation_finished.emit(False, "Installation cancelled by user")
@@ -1511,7 +1853,12 @@ class InstallModlistScreen(QWidget):
                     else:
                         self.installation_finished.emit(False, "Installation failed")
                 except Exception as e:
-                    self.installation_finished.emit(False, f"Installation error: {str(e)}")
+                    # Only pay for walking the frame chain when someone will read it
+                    if _debug_enabled():
+                        error_msg = f"Installation error: {e}\n{traceback.format_exc()}"
+                    else:
+                        error_msg = f"Installation error: {e}"
+                    self.installation_finished.emit(False, error_msg)
                 finally:
                     if self.cancelled and self.process_manager:
                         self.process_manager.cancel()
@@ -1525,27 +1872,24 @@ class InstallModlistScreen(QWidget):
         self.install_thread.installation_finished.connect(self.on_installation_finished)
         self.install_thread.start()
 
-    def on_installation_output(self, message):
-        """Handle regular output from installation thread"""
-        # Filter out internal status messages from user console
-        if message.strip().startswith('[Jackify]'):
-            # Log internal messages to file but don't show in console
-            self._write_to_log_file(message)
-            return
-        self._safe_append_text(message)
+    def on_installation_output(self, messages):
+        """Handle a batch of regular output lines from installation thread"""
+        # Internal [Jackify] messages are logged but filtered from the console
+        self._safe_append_lines(messages)
     
-    def on_installation_progress(self, progress_message):
+    def on_installation_progress(self, progress_messages):
         """Replace the last line in the console for progress updates"""
-        cursor = self.console.textCursor()
-        cursor.movePosition(QTextCursor.End)
-        cursor.movePosition(QTextCursor.StartOfLine, QTextCursor.KeepAnchor)
-        cursor.removeSelectedText()
-        cursor.insertText(progress_message)
+        # Each update overwrites the previous one, so only the newest matters.
+        # Flush buffered lines first so the update replaces the real last line.
+        self._flush_console()
+        cursor = QTextCursor(self.console.document().lastBlock())
+        cursor.movePosition(QTextCursor.EndOfBlock, QTextCursor.KeepAnchor)
+        cursor.insertText(progress_messages[-1])
         # Don't force scroll for progress updates - let user control
     
     def on_installation_finished(self, success, message):
         """Handle installation completion"""
-        debug_print(f"DEBUG: on_installation_finished called with success={success}, message={message}")
+        debug_print("DEBUG: on_installation_finished called with success=%s, message=%s", success, message)
         if success:
             self._safe_append_text(f"\nSuccess: {message}")
             self.process_finished(0, QProcess.NormalExit)  # Simulate successful completion
@@ -1554,7 +1898,7 @@ class InstallModlistScreen(QWidget):
             self.process_finished(1, QProcess.CrashExit)  # Simulate error
 
     def process_finished(self, exit_code, exit_status):
-        debug_print(f"DEBUG: process_finished called with exit_code={exit_code}, exit_status={exit_status}")
+        debug_print("DEBUG: process_finished called with exit_code=%s, exit_status=%s", exit_code, exit_status)
         # Reset button states
         self.start_btn.setEnabled(True)
         self.cancel_btn.setVisible(True)
@@ -1612,6 +1956,7 @@ class InstallModlistScreen(QWidget):
                     self._enable_controls_after_operation()
         else:
             # Check for user cancellation first
+            self._flush_console()
             last_output = self.console.toPlainText()
             if "cancelled by user" in last_output.lower():
                 MessageService.information(self, "Installation Cancelled", "The installation was cancelled by the user.", safety_level="low")
@@ -1622,7 +1967,7 @@ class InstallModlistScreen(QWidget):
 
     def _setup_scroll_tracking(self):
         """Set up scroll tracking for professional auto-scroll behavior"""
-        scrollbar = self.console.verticalScrollBar()
+        scrollbar = self._scrollbar = self.console.verticalScrollBar()
         scrollbar.sliderPressed.connect(self._on_scrollbar_pressed)
         scrollbar.sliderReleased.connect(self._on_scrollbar_released)
         scrollbar.valueChanged.connect(self._on_scrollbar_value_changed)
@@ -1637,19 +1982,18 @@ class InstallModlistScreen(QWidget):
 
     def _on_scrollbar_value_changed(self):
         """Track if user is at bottom of scroll area"""
-        scrollbar = self.console.verticalScrollBar()
+        scrollbar = self._scrollbar
         # Use tolerance to account for rounding and rapid updates
         self._was_at_bottom = scrollbar.value() >= scrollbar.maximum() - 1
         
         # If user manually scrolls to bottom, reset manual scroll flag
         if self._was_at_bottom and self._user_manually_scrolled:
             # Small delay to allow user to scroll away if they want
-            from PySide6.QtCore import QTimer
             QTimer.singleShot(100, self._reset_manual_scroll_if_at_bottom)
     
     def _reset_manual_scroll_if_at_bottom(self):
         """Reset manual scroll flag if user is still at bottom after delay"""
-        scrollbar = self.console.verticalScrollBar()
+        scrollbar = self._scrollbar
         if scrollbar.value() >= scrollbar.maximum() - 1:
             self._user_manually_scrolled = False
 
@@ -1662,34 +2006,102 @@ class InstallModlistScreen(QWidget):
         if text.strip().startswith('[Jackify]'):
             # Internal messages are logged but not shown in user console
             return
-            
-        scrollbar = self.console.verticalScrollBar()
+        self._queue_console_lines([text])
+
+    def _safe_append_lines(self, lines):
+        """Append a batch of lines to the console with a single update"""
+        visible = []
+        for line in lines:
+            # Write all messages to log file (including internal messages)
+            self._write_to_log_file(line)
+            if not line.strip().startswith('[Jackify]'):
+                visible.append(line)
+        if visible:
+            self._queue_console_lines(visible)
+
+    def _queue_console_lines(self, lines):
+        """Buffer console lines; they are appended together when the flush timer fires"""
+        self._console_buffer.extend(lines)
+        if not self._console_flush_timer.isActive():
+            self._console_flush_timer.start(50)
+
+    def _flush_console(self):
+        """Append all buffered console lines as a single document change"""
+        self._console_flush_timer.stop()
+        if self._console_buffer:
+            text = '\n'.join(self._console_buffer)
+            self._console_buffer.clear()
+            self._append_to_console(text)
+
+    def _clear_console(self):
+        """Clear the console, dropping any lines still waiting to be appended"""
+        self._console_flush_timer.stop()
+        self._console_buffer.clear()
+        self.console.clear()
+
+    def _append_to_console(self, text):
+        """Add text to the console, keeping it scrolled to the bottom unless the user scrolled away"""
+        scrollbar = self._scrollbar
         # Check if user was at bottom BEFORE adding text
         was_at_bottom = (scrollbar.value() >= scrollbar.maximum() - 1)  # Allow 1px tolerance
         
         # Add the text
-        self.console.append(text)
+        self.console.appendPlainText(text)
         
         # Auto-scroll if user was at bottom and hasn't manually scrolled
         # Re-check bottom state after text addition for better reliability
         if (was_at_bottom and not self._user_manually_scrolled) or \
            (not self._user_manually_scrolled and scrollbar.value() >= scrollbar.maximum() - 2):
-            scrollbar.setValue(scrollbar.maximum())
-            # Ensure user can still manually scroll up during rapid updates
-            if scrollbar.value() == scrollbar.maximum():
-                self._was_at_bottom = True
+            # Coalesce scroll requests into one per event-loop iteration
+            if not self._scroll_pending:
+                self._scroll_pending = True
+                QTimer.singleShot(0, self._flush_scroll)
+
+    def _flush_scroll(self):
+        """Scroll the console to the bottom once for all appends since the last flush"""
+        self._scroll_pending = False
+        if self._user_manually_scrolled:
+            return
+        scrollbar = self._scrollbar
+        scrollbar.setValue(scrollbar.maximum())
+        # Ensure user can still manually scroll up during rapid updates
+        if scrollbar.value() == scrollbar.maximum():
+            self._was_at_bottom = True
 
     def _write_to_log_file(self, message):
         """Write message to workflow log file with timestamp"""
         try:
-            from datetime import datetime
-            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            with open(self.modlist_log_path, 'a', encoding='utf-8') as f:
-                f.write(f"[{timestamp}] {message}\n")
+            timestamp = datetime.now().isoformat(sep=' ', timespec='seconds')
+            with self._log_lock:
+                if self._log_fp is None:
+                    self._log_fp = open(self.modlist_log_path, 'a', buffering=64 * 1024, encoding='utf-8')
+                self._log_fp.write(f"[{timestamp}] {message}\n")
+            # Flush shortly after a burst rather than on every line
+            if not self._log_flush_timer.isActive():
+                self._log_flush_timer.start(1000)
         except Exception:
             # Logging should never break the workflow
             pass
 
+    def _flush_log_file(self):
+        """Flush buffered workflow log output to disk"""
+        with self._log_lock:
+            if self._log_fp is not None:
+                try:
+                    self._log_fp.flush()
+                except Exception:
+                    pass
+
+    def _close_log_file(self):
+        """Flush and close the workflow log handle"""
+        with self._log_lock:
+            if self._log_fp is not None:
+                try:
+                    self._log_fp.close()
+                except Exception:
+                    pass
+                self._log_fp = None
+
     def restart_steam_and_configure(self):
         """Restart Steam using backend service directly - DECOUPLED FROM CLI"""
         debug_print("DEBUG: restart_steam_and_configure called - using direct backend service")
@@ -1700,30 +2112,23 @@ class InstallModlistScreen(QWidget):
         progress.setValue(0)
         progress.show()
         
-        def do_restart():
-            debug_print("DEBUG: do_restart thread started - using direct backend service")
-            try:
-                from jackify.backend.handlers.shortcut_handler import ShortcutHandler
-                
-                # Use backend service directly instead of CLI subprocess
-                shortcut_handler = ShortcutHandler(steamdeck=False)  # TODO: Use proper system info
-                
-                debug_print("DEBUG: About to call secure_steam_restart()")
-                success = shortcut_handler.secure_steam_restart()
-                debug_print(f"DEBUG: secure_steam_restart() returned: {success}")
-                
-                out = "Steam restart completed successfully." if success else "Steam restart failed."
-                
-            except Exception as e:
-                debug_print(f"DEBUG: Exception in do_restart: {e}")
-                success = False
-                out = str(e)
-                
-            self.steam_restart_finished.emit(success, out)
-            
-        threading.Thread(target=do_restart, daemon=True).start()
+        # Use backend service directly instead of CLI subprocess
+        self.steam_restart_thread = SteamRestartThread(self.steam_restart_finished)
+        self.steam_restart_thread.start()
         self._steam_restart_progress = progress  # Store to close later
 
+    def _get_shortcut_handler(self):
+        """Return the shared ShortcutHandler, creating it on first use"""
+        if self._shortcut_handler is None:
+            self._shortcut_handler = ShortcutHandler(steamdeck=False)  # TODO: Use proper system info
+        return self._shortcut_handler
+
+    def _get_path_handler(self):
+        """Return the shared PathHandler, creating it on first use"""
+        if self._path_handler is None:
+            self._path_handler = PathHandler()
+        return self._path_handler
+
     def _on_steam_restart_finished(self, success, out):
         debug_print("DEBUG: _on_steam_restart_finished called")
         # Safely cleanup progress dialog on main thread
@@ -1732,7 +2137,7 @@ class InstallModlistScreen(QWidget):
                 self._steam_restart_progress.close()
                 self._steam_restart_progress.deleteLater()  # Use deleteLater() for safer cleanup
             except Exception as e:
-                debug_print(f"DEBUG: Error closing progress dialog: {e}")
+                debug_print("DEBUG: Error closing progress dialog: %s", e)
             finally:
                 self._steam_restart_progress = None
         
@@ -1756,16 +2161,19 @@ class InstallModlistScreen(QWidget):
             self._safe_append_text("Failed to restart Steam.\n" + out)
             MessageService.critical(self, "Steam Restart Failed", "Failed to restart Steam automatically. Please restart Steam manually, then try again.")
 
-    def start_automated_prefix_workflow(self):
+    def start_automated_prefix_workflow(self, modlist_name=None):
+        """Start the automated prefix creation workflow"""
         # Ensure _current_resolution is always set before starting workflow
         if not hasattr(self, '_current_resolution') or self._current_resolution is None:
             resolution = self.resolution_combo.currentText() if hasattr(self, 'resolution_combo') else None
             self._current_resolution = resolution.split()[0] if resolution and resolution != "Leave unchanged" else None
-        """Start the automated prefix creation workflow"""
+        self._workflow_defaults = self._build_workflow_defaults()
         try:
             # Disable controls during installation
             self._disable_controls_during_operation()
-            modlist_name = self.modlist_name_edit.text().strip()
+            modlist_name = modlist_name or self.modlist_name_edit.text().strip()
+            # Later workflow steps reuse this rather than re-reading the widget
+            self._current_modlist_name = modlist_name
             install_dir = self.install_dir_edit.text().strip()
             final_exe_path = os.path.join(install_dir, "ModOrganizer.exe")
             
@@ -1791,9 +2199,11 @@ class InstallModlistScreen(QWidget):
                         f"ModOrganizer.exe not found at:\n{final_exe_path}\n\nCannot proceed with automated setup.")
                     return
             
-            # Run automated prefix creation in separate thread
-            from PySide6.QtCore import QThread, Signal
+            # Remember the resolved paths so later workflow steps don't repeat the lookup
+            self._install_dir = Path(install_dir)
+            self._mo2_exe_path = final_exe_path
             
+            # Run automated prefix creation in separate thread
             class AutomatedPrefixThread(QThread):
                 finished = Signal(bool, str, str, str)  # success, prefix_path, appid (as string), last_timestamp
                 progress = Signal(str)  # progress messages
@@ -1810,8 +2220,6 @@ class InstallModlistScreen(QWidget):
                 
                 def run(self):
                     try:
-                        from jackify.backend.services.automated_prefix_service import AutomatedPrefixService
-                        
                         def progress_callback(message):
                             self.progress.emit(message)
                             # Show progress dialog during Steam restart
@@ -1823,7 +2231,6 @@ class InstallModlistScreen(QWidget):
                         prefix_service = AutomatedPrefixService()
                         # Determine Steam Deck once and pass through the workflow
                         try:
-                            import os
                             _is_steamdeck = False
                             if os.path.exists('/etc/os-release'):
                                 with open('/etc/os-release') as f:
@@ -1836,34 +2243,12 @@ class InstallModlistScreen(QWidget):
                         )
                         
                         # Handle the result - check for conflicts
-                        if isinstance(result, tuple) and len(result) == 4:
-                            if result[0] == "CONFLICT":
-                                # Conflict detected - emit signal to main GUI
-                                conflicts = result[1]
-                                self.hide_progress_dialog.emit()
-                                self.conflict_detected.emit(conflicts)
-                                return
-                            else:
-                                # Normal result with timestamp
-                                success, prefix_path, new_appid, last_timestamp = result
-                        elif isinstance(result, tuple) and len(result) == 3:
-                            # Fallback for old format (backward compatibility)
-                            if result[0] == "CONFLICT":
-                                # Conflict detected - emit signal to main GUI
-                                conflicts = result[1]
-                                self.hide_progress_dialog.emit()
-                                self.conflict_detected.emit(conflicts)
-                                return
-                            else:
-                                # Normal result (old format)
-                                success, prefix_path, new_appid = result
-                                last_timestamp = None
-                        else:
-                            # Handle non-tuple result
-                            success = result
-                            prefix_path = ""
-                            new_appid = "0"
-                            last_timestamp = None
+                        success, prefix_path, new_appid, last_timestamp = _normalize_workflow_result(result)
+                        if success == "CONFLICT":
+                            # Conflict detected - emit signal to main GUI (prefix_path holds the conflicts)
+                            self.hide_progress_dialog.emit()
+                            self.conflict_detected.emit(prefix_path)
+                            return
                         
                         # Ensure progress dialog is hidden when workflow completes
                         self.hide_progress_dialog.emit()
@@ -1885,9 +2270,9 @@ class InstallModlistScreen(QWidget):
             self.prefix_thread.start()
             
         except Exception as e:
-            debug_print(f"DEBUG: Exception in start_automated_prefix_workflow: {e}")
-            import traceback
-            debug_print(f"DEBUG: Traceback: {traceback.format_exc()}")
+            debug_print("DEBUG: Exception in start_automated_prefix_workflow: %s", e)
+            if _debug_enabled():
+                debug_print("DEBUG: Traceback: %s", traceback.format_exc())
             self._safe_append_text(f"ERROR: Failed to start automated workflow: {e}")
             # Re-enable controls on exception
             self._enable_controls_after_operation()
@@ -1896,16 +2281,16 @@ class InstallModlistScreen(QWidget):
         """Handle completion of automated prefix creation"""
         try:
             if success:
-                debug_print(f"SUCCESS: Automated prefix creation completed!")
-                debug_print(f"Prefix created at: {prefix_path}")
+                debug_print("SUCCESS: Automated prefix creation completed!")
+                debug_print("Prefix created at: %s", prefix_path)
                 if new_appid_str and new_appid_str != "0":
-                    debug_print(f"AppID: {new_appid_str}")
+                    debug_print("AppID: %s", new_appid_str)
                 
                 # Convert string AppID back to integer for configuration
                 new_appid = int(new_appid_str) if new_appid_str and new_appid_str != "0" else None
                 
                 # Continue with configuration using the new AppID and timestamp
-                modlist_name = self.modlist_name_edit.text().strip()
+                modlist_name = self._current_modlist_name
                 install_dir = self.install_dir_edit.text().strip()
                 self.continue_configuration_after_automated_prefix(new_appid, modlist_name, install_dir, last_timestamp)
             else:
@@ -1933,13 +2318,11 @@ class InstallModlistScreen(QWidget):
     
     def on_configuration_progress(self, progress_msg):
         """Handle progress updates from modlist configuration"""
-        self._safe_append_text(progress_msg)
+        # Captured configuration output arrives as ansi_to_html markup; the console is plain text
+        self._safe_append_text(ansi_html_to_text(progress_msg))
     
     def show_steam_restart_progress(self, message):
         """Show Steam restart progress dialog"""
-        from PySide6.QtWidgets import QProgressDialog
-        from PySide6.QtCore import Qt
-        
         self.steam_restart_progress = QProgressDialog(message, None, 0, 0, self)
         self.steam_restart_progress.setWindowTitle("Restarting Steam")
         self.steam_restart_progress.setWindowModality(Qt.WindowModal)
@@ -1971,8 +2354,6 @@ class InstallModlistScreen(QWidget):
                     self._show_somnium_post_install_guidance()
                 
                 # Show celebration SuccessDialog after the entire workflow
-                from ..dialogs import SuccessDialog
-                import time
                 if not hasattr(self, '_install_workflow_start_time'):
                     self._install_workflow_start_time = time.time()
                 time_taken = int(time.time() - self._install_workflow_start_time)
@@ -2008,20 +2389,8 @@ class InstallModlistScreen(QWidget):
             # Ensure controls are re-enabled even on unexpected errors
             self._enable_controls_after_operation()
             raise
-        # Clean up thread
-        if hasattr(self, 'config_thread') and self.config_thread is not None:
-            # Disconnect all signals to prevent "Internal C++ object already deleted" errors
-            try:
-                self.config_thread.progress_update.disconnect()
-                self.config_thread.configuration_complete.disconnect()
-                self.config_thread.error_occurred.disconnect()
-            except:
-                pass  # Ignore errors if already disconnected
-            if self.config_thread.isRunning():
-                self.config_thread.quit()
-                self.config_thread.wait(5000)  # Wait up to 5 seconds
-            self.config_thread.deleteLater()
-            self.config_thread = None
+        # Stop listening to the finished configuration run
+        self._release_config_thread()
 
     def on_configuration_error(self, error_message):
         """Handle configuration error on main thread"""
@@ -2031,51 +2400,45 @@ class InstallModlistScreen(QWidget):
         # Re-enable all controls on error
         self._enable_controls_after_operation()
 
-        # Clean up thread
-        if hasattr(self, 'config_thread') and self.config_thread is not None:
-            # Disconnect all signals to prevent "Internal C++ object already deleted" errors
-            try:
-                self.config_thread.progress_update.disconnect()
-                self.config_thread.configuration_complete.disconnect()
-                self.config_thread.error_occurred.disconnect()
-            except:
-                pass  # Ignore errors if already disconnected
-            if self.config_thread.isRunning():
-                self.config_thread.quit()
-                self.config_thread.wait(5000)  # Wait up to 5 seconds
-            self.config_thread.deleteLater()
-            self.config_thread = None
+        # Stop listening to the finished configuration run
+        self._release_config_thread()
 
     def show_manual_steps_dialog(self, extra_warning=""):
         modlist_name = self.modlist_name_edit.text().strip() or "your modlist"
-        msg = (
-            f"<b>Manual Proton Setup Required for <span style='color:#3fd0ea'>{modlist_name}</span></b><br>"
-            "After Steam restarts, complete the following steps in Steam:<br>"
-            f"1. Locate the '<b>{modlist_name}</b>' entry in your Steam Library<br>"
-            "2. Right-click and select 'Properties'<br>"
-            "3. Switch to the 'Compatibility' tab<br>"
-            "4. Check the box labeled 'Force the use of a specific Steam Play compatibility tool'<br>"
-            "5. Select 'Proton - Experimental' from the dropdown menu<br>"
-            "6. Close the Properties window<br>"
-            f"7. Launch '<b>{modlist_name}</b>' from your Steam Library<br>"
-            "8. Wait for Mod Organizer 2 to fully open<br>"
-            "9. Once Mod Organizer has fully loaded, CLOSE IT completely and return here<br>"
-            "<br>Once you have completed ALL the steps above, click OK to continue."
-            f"{extra_warning}"
-        )
-        reply = MessageService.question(self, "Manual Steps Required", msg, safety_level="medium")
-        if reply == QMessageBox.Yes:
+        msg = _MANUAL_STEPS_TEMPLATE.format(name=modlist_name, extra=extra_warning)
+        # Same medium-safety box MessageService.question builds, but opened without a nested event loop
+        box = SafeMessageBox(self, safety_level="medium")
+        box.setup_safety_features("Manual Steps Required", msg, "Yes", "No", is_question=True)
+        # setup_safety_features rewires the buttons to done(Yes/No), so buttonClicked never fires
+        box.finished.connect(self._on_manual_steps_reply)
+        # Keep a reference so the box is not collected while Steam steps are performed
+        self._manual_steps_box = box
+        box.open()
+
+    def _on_manual_steps_reply(self, result):
+        """Continue or cancel the workflow once the manual steps dialog is answered"""
+        box = self._manual_steps_box
+        self._manual_steps_box = None
+        box.deleteLater()
+        if result == QMessageBox.Yes:
             self.validate_manual_steps_completion()
         else:
             # User clicked Cancel or closed the dialog - cancel the workflow
-            self._safe_append_text("\n🛑 Manual steps cancelled by user. Workflow stopped.")
-            # Re-enable all controls when workflow is cancelled
-            self._enable_controls_after_operation()
-            self.cancel_btn.setVisible(True)
-            self.cancel_install_btn.setVisible(False)
+            self._cancel_manual_steps()
+
+    def _cancel_manual_steps(self):
+        """Stop the workflow after the user declines to (re)do the manual steps"""
+        self._safe_append_text("\n🛑 Manual steps cancelled by user. Workflow stopped.")
+        # Re-enable all controls when workflow is cancelled
+        self._enable_controls_after_operation()
+        self.cancel_btn.setVisible(True)
+        self.cancel_install_btn.setVisible(False)
 
     def _get_mo2_path(self, install_dir, modlist_name):
         """Get ModOrganizer.exe path, handling Somnium's non-standard structure"""
+        # Reuse the path resolved when the workflow started for this install directory
+        if self._mo2_exe_path is not None and self._install_dir == Path(install_dir):
+            return self._mo2_exe_path
         mo2_exe_path = os.path.join(install_dir, "ModOrganizer.exe")
         if not os.path.exists(mo2_exe_path) and "somnium" in modlist_name.lower():
             somnium_path = os.path.join(install_dir, "files", "ModOrganizer.exe")
@@ -2085,99 +2448,110 @@ class InstallModlistScreen(QWidget):
 
     def validate_manual_steps_completion(self):
         """Validate that manual steps were actually completed and handle retry logic"""
-        modlist_name = self.modlist_name_edit.text().strip()
+        modlist_name = self._current_modlist_name or self.modlist_name_edit.text().strip()
         install_dir = self.install_dir_edit.text().strip()
         mo2_exe_path = self._get_mo2_path(install_dir, modlist_name)
         
         # Add delay to allow Steam filesystem updates to complete
         self._safe_append_text("Waiting for Steam filesystem updates to complete...")
-        import time
         time.sleep(2)
         
         # CRITICAL: Re-detect the AppID after Steam restart and manual steps
         # Steam assigns a NEW AppID during restart, different from the one we initially created
-        self._safe_append_text(f"Re-detecting AppID for shortcut '{modlist_name}' after Steam restart...")
-        from jackify.backend.handlers.shortcut_handler import ShortcutHandler
-        shortcut_handler = ShortcutHandler(steamdeck=False)
-        current_appid = shortcut_handler.get_appid_for_shortcut(modlist_name, mo2_exe_path)
+        # Messages are collected per phase and appended to the console in one go
+        msgs = [f"Re-detecting AppID for shortcut '{modlist_name}' after Steam restart..."]
+        current_appid = self._get_shortcut_handler().get_appid_for_shortcut(modlist_name, mo2_exe_path)
         
         if not current_appid or not current_appid.isdigit():
-            self._safe_append_text(f"Error: Could not find Steam-assigned AppID for shortcut '{modlist_name}'")
-            self._safe_append_text("Error: This usually means the shortcut was not launched from Steam")
-            self._safe_append_text("Suggestion: Check that Steam is running and shortcuts are visible in library")
+            msgs.append(f"Error: Could not find Steam-assigned AppID for shortcut '{modlist_name}'")
+            msgs.append("Error: This usually means the shortcut was not launched from Steam")
+            msgs.append("Suggestion: Check that Steam is running and shortcuts are visible in library")
+            self._safe_append_lines(msgs)
             self.handle_validation_failure("Could not find Steam shortcut")
             return
         
-        self._safe_append_text(f"Found Steam-assigned AppID: {current_appid}")
-        self._safe_append_text(f"Validating manual steps completion for AppID: {current_appid}")
+        msgs.append(f"Found Steam-assigned AppID: {current_appid}")
+        msgs.append(f"Validating manual steps completion for AppID: {current_appid}")
+        
+        # Both checks below need the compatdata location, so search for it only once.
+        # find_compat_data only returns directories that exist, so no further stat is needed.
+        try:
+            compat_path = self._get_path_handler().find_compat_data(current_appid)
+            compat_data_error = None
+        except Exception as e:
+            compat_path = None
+            compat_data_error = e
         
         # Check 1: Proton version
         proton_ok = False
-        try:
-            from jackify.backend.handlers.modlist_handler import ModlistHandler
-            from jackify.backend.handlers.path_handler import PathHandler
-            
-            # Initialize ModlistHandler with correct parameters
-            path_handler = PathHandler()
-            modlist_handler = ModlistHandler(steamdeck=False, verbose=False)
-            
-            # Set required properties manually after initialization
-            modlist_handler.modlist_dir = install_dir
-            modlist_handler.appid = current_appid
-            modlist_handler.game_var = "skyrimspecialedition"  # Default for now
-            
-            # Set compat_data_path for Proton detection
-            compat_data_path_str = path_handler.find_compat_data(current_appid)
-            if compat_data_path_str:
-                from pathlib import Path
-                modlist_handler.compat_data_path = Path(compat_data_path_str)
-            
-            # Check Proton version
-            self._safe_append_text(f"Attempting to detect Proton version for AppID {current_appid}...")
-            if modlist_handler._detect_proton_version():
-                self._safe_append_text(f"Raw detected Proton version: '{modlist_handler.proton_ver}'")
-                if modlist_handler.proton_ver and 'experimental' in modlist_handler.proton_ver.lower():
-                    proton_ok = True
-                    self._safe_append_text(f"Proton version validated: {modlist_handler.proton_ver}")
+        cached_proton_ver = self._proton_cache.get(current_appid)
+        if cached_proton_ver:
+            # Already validated on an earlier attempt for this AppID
+            proton_ok = True
+            msgs.append(f"Proton version validated: {cached_proton_ver}")
+        else:
+            try:
+                from jackify.backend.handlers.modlist_handler import ModlistHandler
+            
+                # Initialize ModlistHandler with correct parameters
+                modlist_handler = ModlistHandler(steamdeck=False, verbose=False)
+            
+                # Set required properties manually after initialization
+                modlist_handler.modlist_dir = install_dir
+                modlist_handler.appid = current_appid
+                modlist_handler.game_var = "skyrimspecialedition"  # Default for now
+            
+                # Set compat_data_path for Proton detection
+                if compat_path:
+                    modlist_handler.compat_data_path = compat_path
+            
+                # Check Proton version
+                msgs.append(f"Attempting to detect Proton version for AppID {current_appid}...")
+                if modlist_handler._detect_proton_version():
+                    msgs.append(f"Raw detected Proton version: '{modlist_handler.proton_ver}'")
+                    if modlist_handler.proton_ver and 'experimental' in modlist_handler.proton_ver.lower():
+                        proton_ok = True
+                        self._proton_cache[current_appid] = modlist_handler.proton_ver
+                        msgs.append(f"Proton version validated: {modlist_handler.proton_ver}")
+                    else:
+                        msgs.append(f"Error: Wrong Proton version detected: '{modlist_handler.proton_ver}' (expected 'experimental' in name)")
                 else:
-                    self._safe_append_text(f"Error: Wrong Proton version detected: '{modlist_handler.proton_ver}' (expected 'experimental' in name)")
-            else:
-                self._safe_append_text("Error: Could not detect Proton version from any source")
+                    msgs.append("Error: Could not detect Proton version from any source")
                 
-        except Exception as e:
-            self._safe_append_text(f"Error checking Proton version: {e}")
-            proton_ok = False
+            except Exception as e:
+                msgs.append(f"Error checking Proton version: {e}")
+                proton_ok = False
+        self._safe_append_lines(msgs)
         
         # Check 2: Compatdata directory exists
         compatdata_ok = False
+        msgs = []
         try:
-            from jackify.backend.handlers.path_handler import PathHandler
-            path_handler = PathHandler()
-            
-            self._safe_append_text(f"Searching for compatdata directory for AppID {current_appid}...")
-            self._safe_append_text("Checking standard Steam locations and Flatpak Steam...")
-            prefix_path_str = path_handler.find_compat_data(current_appid)
-            self._safe_append_text(f"Compatdata search result: '{prefix_path_str}'")
+            msgs.append(f"Searching for compatdata directory for AppID {current_appid}...")
+            msgs.append("Checking standard Steam locations and Flatpak Steam...")
+            if compat_data_error is not None:
+                raise compat_data_error
+            msgs.append(f"Compatdata search result: '{compat_path}'")
             
-            if prefix_path_str and os.path.isdir(prefix_path_str):
+            if compat_path:
                 compatdata_ok = True
-                self._safe_append_text(f"Compatdata directory found: {prefix_path_str}")
+                msgs.append(f"Compatdata directory found: {compat_path}")
             else:
-                if prefix_path_str:
-                    self._safe_append_text(f"Error: Path exists but is not a directory: {prefix_path_str}")
-                else:
-                    self._safe_append_text(f"Error: No compatdata directory found for AppID {current_appid}")
-                    self._safe_append_text("Suggestion: Ensure you launched the shortcut from Steam at least once")
-                    self._safe_append_text("Suggestion: Check if Steam is using Flatpak (different file paths)")
+                msgs.append(f"Error: No compatdata directory found for AppID {current_appid}")
+                msgs.append("Suggestion: Ensure you launched the shortcut from Steam at least once")
+                msgs.append("Suggestion: Check if Steam is using Flatpak (different file paths)")
                 
         except Exception as e:
-            self._safe_append_text(f"Error checking compatdata: {e}")
+            msgs.append(f"Error checking compatdata: {e}")
             compatdata_ok = False
+        self._safe_append_lines(msgs)
         
         # Handle validation results
         if proton_ok and compatdata_ok:
-            self._safe_append_text("Manual steps validation passed!")
-            self._safe_append_text("Continuing configuration with updated AppID...")
+            self._safe_append_lines([
+                "Manual steps validation passed!",
+                "Continuing configuration with updated AppID...",
+            ])
             
             # Continue configuration with the corrected AppID and context
             self.continue_configuration_after_manual_steps(current_appid, modlist_name, install_dir)
@@ -2198,57 +2572,16 @@ class InstallModlistScreen(QWidget):
         conflict_names = [c['name'] for c in conflicts]
         conflict_info = f"Found existing Steam shortcut: '{conflict_names[0]}'"
         
-        modlist_name = self.modlist_name_edit.text().strip()
+        modlist_name = self._current_modlist_name or self.modlist_name_edit.text().strip()
         
         # Create dialog with Jackify styling
-        from PySide6.QtWidgets import QDialog, QVBoxLayout, QLabel, QLineEdit, QPushButton, QHBoxLayout
-        from PySide6.QtCore import Qt
-        
         dialog = QDialog(self)
         dialog.setWindowTitle("Steam Shortcut Conflict")
-        dialog.setModal(True)
+        dialog.setWindowModality(Qt.WindowModal)
         dialog.resize(450, 180)
         
         # Apply Jackify dark theme styling
-        dialog.setStyleSheet("""
-            QDialog {
-                background-color: #2b2b2b;
-                color: #ffffff;
-            }
-            QLabel {
-                color: #ffffff;
-                font-size: 14px;
-                padding: 10px 0px;
-            }
-            QLineEdit {
-                background-color: #404040;
-                color: #ffffff;
-                border: 2px solid #555555;
-                border-radius: 4px;
-                padding: 8px;
-                font-size: 14px;
-                selection-background-color: #3fd0ea;
-            }
-            QLineEdit:focus {
-                border-color: #3fd0ea;
-            }
-            QPushButton {
-                background-color: #404040;
-                color: #ffffff;
-                border: 2px solid #555555;
-                border-radius: 4px;
-                padding: 8px 16px;
-                font-size: 14px;
-                min-width: 120px;
-            }
-            QPushButton:hover {
-                background-color: #505050;
-                border-color: #3fd0ea;
-            }
-            QPushButton:pressed {
-                background-color: #303030;
-            }
-        """)
+        dialog.setStyleSheet(_CONFLICT_DIALOG_QSS)
         
         layout = QVBoxLayout(dialog)
         layout.setContentsMargins(20, 20, 20, 20)
@@ -2276,42 +2609,58 @@ class InstallModlistScreen(QWidget):
         layout.addLayout(button_layout)
         
         # Connect signals
-        def on_create():
-            new_name = name_input.text().strip()
-            if new_name and new_name != modlist_name:
-                dialog.accept()
-                # Retry workflow with new name
-                self.retry_automated_workflow_with_new_name(new_name)
-            elif new_name == modlist_name:
-                # Same name - show warning
-                from jackify.backend.services.message_service import MessageService
-                MessageService.warning(self, "Same Name", "Please enter a different name to resolve the conflict.")
-            else:
-                # Empty name
-                from jackify.backend.services.message_service import MessageService
-                MessageService.warning(self, "Invalid Name", "Please enter a valid shortcut name.")
-        
-        def on_cancel():
-            dialog.reject()
-            self._safe_append_text("Shortcut creation cancelled by user")
-        
-        create_button.clicked.connect(on_create)
-        cancel_button.clicked.connect(on_cancel)
+        create_button.clicked.connect(self._on_conflict_create)
+        cancel_button.clicked.connect(dialog.reject)
+        dialog.accepted.connect(self._on_conflict_accept)
+        dialog.rejected.connect(self._on_conflict_reject)
         
         # Make Enter key work
-        name_input.returnPressed.connect(on_create)
-        
-        dialog.exec()
+        name_input.returnPressed.connect(self._on_conflict_create)
+        
+        # Keep references alive; open() returns immediately so the event loop keeps running
+        self._conflict_dialog = dialog
+        self._conflict_name_input = name_input
+        self._conflict_original_name = modlist_name
+        self._conflict_new_name = None
+        dialog.open()
+    
+    def _on_conflict_create(self):
+        """Validate the replacement shortcut name and accept the conflict dialog"""
+        new_name = self._conflict_name_input.text().strip()
+        if new_name and new_name != self._conflict_original_name:
+            self._conflict_new_name = new_name
+            self._conflict_dialog.accept()
+        elif new_name == self._conflict_original_name:
+            # Same name - show warning
+            MessageService.warning(self, "Same Name", "Please enter a different name to resolve the conflict.")
+        else:
+            # Empty name
+            MessageService.warning(self, "Invalid Name", "Please enter a valid shortcut name.")
+    
+    def _on_conflict_accept(self):
+        """Retry the automated workflow with the name chosen in the conflict dialog"""
+        self._conflict_dialog.deleteLater()
+        self._conflict_dialog = None
+        # Retry workflow with new name
+        self.retry_automated_workflow_with_new_name(self._conflict_new_name)
+    
+    def _on_conflict_reject(self):
+        """Handle the conflict dialog being cancelled or closed"""
+        self._conflict_dialog.deleteLater()
+        self._conflict_dialog = None
+        self._safe_append_text("Shortcut creation cancelled by user")
     
     def retry_automated_workflow_with_new_name(self, new_name):
         """Retry the automated workflow with a new shortcut name"""
-        # Update the modlist name field temporarily
-        original_name = self.modlist_name_edit.text()
+        # Update the modlist name field to match the new shortcut
         self.modlist_name_edit.setText(new_name)
         
+        # A new shortcut gets a new AppID, so earlier Proton results no longer apply
+        self._proton_cache.clear()
+        
         # Restart the automated workflow
         self._safe_append_text(f"Retrying with new shortcut name: '{new_name}'")
-        self.start_automated_prefix_workflow()
+        self.start_automated_prefix_workflow(new_name)
     
     def continue_configuration_after_automated_prefix(self, new_appid, modlist_name, install_dir, last_timestamp=None):
         """Continue the configuration process with the new AppID after automated prefix creation"""
@@ -2319,98 +2668,25 @@ class InstallModlistScreen(QWidget):
         # No need to show them again here
         debug_print("Configuration phase continues after Steam Integration")
         
-        debug_print(f"continue_configuration_after_automated_prefix called with appid: {new_appid}")
+        debug_print("continue_configuration_after_automated_prefix called with appid: %s", new_appid)
         try:
             # Update the context with the new AppID (same format as manual steps)
             updated_context = {
+                **(self._workflow_defaults or self._build_workflow_defaults()),  # manual_steps_completed since automated prefix is done
                 'name': modlist_name,
                 'path': install_dir,
                 'mo2_exe_path': self._get_mo2_path(install_dir, modlist_name),
-                'modlist_value': None,
-                'modlist_source': None,
-                'resolution': getattr(self, '_current_resolution', None),
-                'skip_confirmation': True,
-                'manual_steps_completed': True,  # Mark as completed since automated prefix is done
                 'appid': new_appid,  # Use the NEW AppID from automated prefix creation
                 'game_name': self.context.get('game_name', 'Skyrim Special Edition') if hasattr(self, 'context') else 'Skyrim Special Edition'
             }
             self.context = updated_context  # Ensure context is always set
-            debug_print(f"Updated context with new AppID: {new_appid}")
-            
-            # Create new config thread with updated context
-            class ConfigThread(QThread):
-                progress_update = Signal(str)
-                configuration_complete = Signal(bool, str, str)
-                error_occurred = Signal(str)
-                
-                def __init__(self, context):
-                    super().__init__()
-                    self.context = context
-                
-                def run(self):
-                    try:
-                        from jackify.backend.services.modlist_service import ModlistService
-                        from jackify.backend.models.configuration import SystemInfo
-                        from jackify.backend.models.modlist import ModlistContext
-                        from pathlib import Path
-                        
-                        # Initialize backend service
-                        system_info = SystemInfo(is_steamdeck=False)
-                        modlist_service = ModlistService(system_info)
-                        
-                        # Convert context to ModlistContext for service
-                        modlist_context = ModlistContext(
-                            name=self.context['name'],
-                            install_dir=Path(self.context['path']),
-                            download_dir=Path(self.context['path']).parent / 'Downloads',  # Default
-                            game_type='skyrim',  # Default for now
-                            nexus_api_key='',  # Not needed for configuration
-                            modlist_value=self.context.get('modlist_value'),
-                            modlist_source=self.context.get('modlist_source', 'identifier'),
-                            resolution=self.context.get('resolution'),
-                            skip_confirmation=True,
-                            engine_installed=True  # Skip path manipulation for engine workflows
-                        )
-                        
-                        # Add app_id to context
-                        modlist_context.app_id = self.context['appid']
-                        
-                        # Define callbacks
-                        def progress_callback(message):
-                            self.progress_update.emit(message)
-                            
-                        def completion_callback(success, message, modlist_name):
-                            self.configuration_complete.emit(success, message, modlist_name)
-                            
-                        def manual_steps_callback(modlist_name, retry_count):
-                            # This shouldn't happen since automated prefix creation is complete
-                            self.progress_update.emit(f"Unexpected manual steps callback for {modlist_name}")
-                        
-                        # Call the service method for post-Steam configuration
-                        result = modlist_service.configure_modlist_post_steam(
-                            context=modlist_context,
-                            progress_callback=progress_callback,
-                            manual_steps_callback=manual_steps_callback,
-                            completion_callback=completion_callback
-                        )
-                        
-                        if not result:
-                            self.progress_update.emit("Configuration failed to start")
-                            self.error_occurred.emit("Configuration failed to start")
-                            
-                    except Exception as e:
-                        self.error_occurred.emit(str(e))
+            debug_print("Updated context with new AppID: %s", new_appid)
             
             # Start configuration thread
-            self.config_thread = ConfigThread(updated_context)
-            self.config_thread.progress_update.connect(self.on_configuration_progress)
-            self.config_thread.configuration_complete.connect(self.on_configuration_complete)
-            self.config_thread.error_occurred.connect(self.on_configuration_error)
-            self.config_thread.start()
+            self._start_config_thread(updated_context, report_start_failure=True)
             
         except Exception as e:
             self._safe_append_text(f"Error continuing configuration: {e}")
-            import traceback
             self._safe_append_text(f"Full traceback: {traceback.format_exc()}")
             self.on_configuration_error(str(e))
 
@@ -2421,116 +2697,66 @@ class InstallModlistScreen(QWidget):
         try:
             # Update the context with the new AppID
             updated_context = {
+                **(self._workflow_defaults or self._build_workflow_defaults()),
                 'name': modlist_name,
                 'path': install_dir,
                 'mo2_exe_path': self._get_mo2_path(install_dir, modlist_name),
-                'modlist_value': None,
-                'modlist_source': None,
-                'resolution': getattr(self, '_current_resolution', None),
-                'skip_confirmation': True,
-                'manual_steps_completed': True,  # Mark as completed
                 'appid': new_appid  # Use the NEW AppID from Steam
             }
             
-            debug_print(f"Updated context with new AppID: {new_appid}")
+            debug_print("Updated context with new AppID: %s", new_appid)
             
-            # Clean up old thread if exists and wait for it to finish
-            if hasattr(self, 'config_thread') and self.config_thread is not None:
-                # Disconnect all signals to prevent "Internal C++ object already deleted" errors
-                try:
-                    self.config_thread.progress_update.disconnect()
-                    self.config_thread.configuration_complete.disconnect()
-                    self.config_thread.error_occurred.disconnect()
-                except:
-                    pass  # Ignore errors if already disconnected
-                if self.config_thread.isRunning():
-                    self.config_thread.quit()
-                    self.config_thread.wait(5000)  # Wait up to 5 seconds
-                self.config_thread.deleteLater()
-                self.config_thread = None
-            
-            # Start new config thread
-            self.config_thread = self._create_config_thread(updated_context)
-            self.config_thread.progress_update.connect(self.on_configuration_progress)
-            self.config_thread.configuration_complete.connect(self.on_configuration_complete)
-            self.config_thread.error_occurred.connect(self.on_configuration_error)
-            self.config_thread.start()
+            # Start configuration thread
+            self._start_config_thread(updated_context)
             
         except Exception as e:
             self._safe_append_text(f"Error continuing configuration: {e}")
             self.on_configuration_error(str(e))
 
-    def _create_config_thread(self, context):
-        """Create a new ConfigThread with proper lifecycle management"""
-        from PySide6.QtCore import QThread, Signal
-        
-        class ConfigThread(QThread):
-            progress_update = Signal(str)
-            configuration_complete = Signal(bool, str, str)
-            error_occurred = Signal(str)
-            
-            def __init__(self, context, parent=None):
-                super().__init__(parent)
-                self.context = context
-                
-            def run(self):
-                try:
-                    from jackify.backend.models.configuration import SystemInfo
-                    from jackify.backend.services.modlist_service import ModlistService
-                    from jackify.backend.models.modlist import ModlistContext
-                    from pathlib import Path
-                    
-                    # Initialize backend service
-                    system_info = SystemInfo(is_steamdeck=False)
-                    modlist_service = ModlistService(system_info)
-                    
-                    # Convert context to ModlistContext for service
-                    modlist_context = ModlistContext(
-                        name=self.context['name'],
-                        install_dir=Path(self.context['path']),
-                        download_dir=Path(self.context['path']).parent / 'Downloads',  # Default
-                        game_type='skyrim',  # Default for now
-                        nexus_api_key='',  # Not needed for configuration
-                        modlist_value=self.context.get('modlist_value', ''),
-                        modlist_source=self.context.get('modlist_source', 'identifier'),
-                        resolution=self.context.get('resolution'),  # Pass resolution from GUI
-                        skip_confirmation=True,
-                        engine_installed=True  # Skip path manipulation for engine workflows
-                    )
-                    
-                    # Add app_id to context
-                    if 'appid' in self.context:
-                        modlist_context.app_id = self.context['appid']
-                    
-                    # Define callbacks
-                    def progress_callback(message):
-                        self.progress_update.emit(message)
-                        
-                    def completion_callback(success, message, modlist_name):
-                        self.configuration_complete.emit(success, message, modlist_name)
-                        
-                    def manual_steps_callback(modlist_name, retry_count):
-                        # This shouldn't happen since manual steps should be done
-                        self.progress_update.emit(f"Unexpected manual steps callback for {modlist_name}")
-                    
-                    # Call the new service method for post-Steam configuration
-                    result = modlist_service.configure_modlist_post_steam(
-                        context=modlist_context,
-                        progress_callback=progress_callback,
-                        manual_steps_callback=manual_steps_callback,
-                        completion_callback=completion_callback
-                    )
-                    
-                    if not result:
-                        self.progress_update.emit("WARNING: configure_modlist_post_steam returned False")
-                    
-                except Exception as e:
-                    import traceback
-                    error_details = f"Error in configuration: {e}\nTraceback: {traceback.format_exc()}"
-                    self.progress_update.emit(f"DEBUG: {error_details}")
-                    self.error_occurred.emit(str(e))
-        
-        return ConfigThread(context, parent=self)
+    def _build_workflow_defaults(self):
+        """Context values shared by both configuration continuations of a workflow"""
+        return {
+            'modlist_value': None,
+            'modlist_source': None,
+            'resolution': getattr(self, '_current_resolution', None),
+            'skip_confirmation': True,
+            'manual_steps_completed': True,
+        }
+
+    def _start_config_thread(self, context, report_start_failure=False):
+        """Run configuration for context on a new ConfigThread, stopping any earlier run"""
+        self._stop_config_thread()
+        thread = ConfigThread(context, report_start_failure, parent=self)
+        # Always emitted from the worker thread, so skip Qt's per-emit connection type resolution
+        thread.progress_update.connect(self.on_configuration_progress, Qt.QueuedConnection)
+        thread.configuration_complete.connect(self.on_configuration_complete, Qt.QueuedConnection)
+        thread.error_occurred.connect(self.on_configuration_error, Qt.QueuedConnection)
+        thread.finished.connect(thread.deleteLater)
+        self.config_thread = thread
+        thread.start()
+
+    def _release_config_thread(self):
+        """Stop listening to the current configuration run and let it finish on its own"""
+        thread = self.config_thread
+        if thread is None:
+            return
+        try:
+            thread.progress_update.disconnect(self.on_configuration_progress)
+            thread.configuration_complete.disconnect(self.on_configuration_complete)
+            thread.error_occurred.disconnect(self.on_configuration_error)
+        except (RuntimeError, TypeError):
+            pass  # Ignore errors if already disconnected
+        self.config_thread = None
+
+    def _stop_config_thread(self):
+        """Terminate a configuration run that is still going (e.g. on cancel or close)"""
+        thread = self.config_thread
+        self._release_config_thread()
+        if thread is not None and thread.isRunning():
+            # Configuration has no cancellation points, so it has to be terminated
+            debug_print("DEBUG: Terminating config_thread")
+            thread.terminate()
+            thread.wait(1000)
 
     def handle_validation_failure(self, missing_text):
         """Handle failed validation with retry logic"""
@@ -2544,14 +2770,19 @@ class InstallModlistScreen(QWidget):
             elif self._manual_steps_retry_count == 2:
                 retry_guidance = "\n\nTip: If using Flatpak Steam, ensure compatdata is being created in the correct location."
             
-            MessageService.critical(self, "Manual Steps Incomplete", 
-                               f"Manual steps validation failed:\n\n{missing_text}\n\n"
-                               f"Please complete the missing steps and try again.{retry_guidance}")
-            # Show manual steps dialog again
-            extra_warning = ""
-            if self._manual_steps_retry_count >= 2:
-                extra_warning = "<br><b style='color:#f33'>It looks like you have not completed the manual steps yet. Please try again.</b>"
-            self.show_manual_steps_dialog(extra_warning)
+            # One non-blocking prompt; Retry goes straight back to the manual steps dialog.
+            # Low safety keeps the Retry label (no countdown) and makes it the default button.
+            box = SafeMessageBox(self, safety_level="low")
+            box.setup_safety_features(
+                "Manual Steps Incomplete",
+                f"Manual steps validation failed:\n\n{missing_text}\n\n"
+                f"Please complete the missing steps and try again.{retry_guidance}",
+                "Retry", "Cancel", is_question=True)
+            box.setIcon(QMessageBox.Critical)
+            # setup_safety_features rewires the buttons to done(Yes/No), so buttonClicked never fires
+            box.finished.connect(self._on_validation_retry_reply)
+            self._validation_retry_box = box
+            box.open()
         else:
             # Max retries reached
             MessageService.critical(self, "Manual Steps Failed", 
@@ -2563,9 +2794,22 @@ class InstallModlistScreen(QWidget):
                                "• Proton - Experimental not selected")
             self.on_configuration_complete(False, "Manual steps validation failed after multiple attempts", self._current_modlist_name)
 
+    def _on_validation_retry_reply(self, result):
+        """Show the manual steps again on Retry, otherwise cancel the workflow"""
+        box = self._validation_retry_box
+        self._validation_retry_box = None
+        box.deleteLater()
+        if result == QMessageBox.Yes:
+            # Show manual steps dialog again
+            extra_warning = ""
+            if self._manual_steps_retry_count >= 2:
+                extra_warning = "<br><b style='color:#f33'>It looks like you have not completed the manual steps yet. Please try again.</b>"
+            self.show_manual_steps_dialog(extra_warning)
+        else:
+            self._cancel_manual_steps()
+
     def show_next_steps_dialog(self, message):
         # EXACT LEGACY show_next_steps_dialog
-        from PySide6.QtWidgets import QDialog, QVBoxLayout, QLabel, QPushButton, QHBoxLayout, QApplication
         dlg = QDialog(self)
         dlg.setWindowTitle("Next Steps")
         dlg.setModal(True)
@@ -2593,26 +2837,53 @@ class InstallModlistScreen(QWidget):
         """Clean up any running processes when the window closes or is cancelled"""
         debug_print("DEBUG: cleanup_processes called - cleaning up InstallationThread and other processes")
         
-        # Clean up InstallationThread if running
-        if hasattr(self, 'install_thread') and self.install_thread.isRunning():
-            debug_print("DEBUG: Cancelling running InstallationThread")
-            self.install_thread.cancel()
-            self.install_thread.wait(3000)  # Wait up to 3 seconds
-            if self.install_thread.isRunning():
-                self.install_thread.terminate()
-        
-        # Clean up other threads
-        threads = [
-            'prefix_thread', 'config_thread', 'fetch_thread'
-        ]
-        for thread_name in threads:
-            if hasattr(self, thread_name):
-                thread = getattr(self, thread_name)
-                if thread and thread.isRunning():
-                    debug_print(f"DEBUG: Terminating {thread_name}")
-                    thread.terminate()
-                    thread.wait(1000)  # Wait up to 1 second
+        # Stop InstallationThread and the other worker threads together
+        self._stop_threads()
+        
+        # Stop a configuration run so it can't keep modifying the install or Steam config
+        self._stop_config_thread()
     
+    def _stop_threads(self, timeout_ms=3000):
+        """Cancel cooperative worker threads, wait for them together, then terminate stragglers"""
+        running = []
+        for thread_name in ('install_thread', 'prefix_thread', 'fetch_thread', 'steam_restart_thread'):
+            thread = getattr(self, thread_name, None)
+            if thread is None or not thread.isRunning():
+                continue
+            if hasattr(thread, 'cancel'):
+                thread.cancel()
+                running.append((thread_name, thread))
+            else:
+                # No cancellation points to wait for, so stop it straight away
+                debug_print("DEBUG: Terminating %s", thread_name)
+                thread.terminate()
+                thread.wait(500)
+        if not running:
+            return
+        
+        loop = QEventLoop()
+        deadline = QTimer()
+        deadline.setSingleShot(True)
+        deadline.timeout.connect(loop.quit)
+        for thread_name, thread in running:
+            thread.finished.connect(loop.quit, Qt.QueuedConnection)
+        
+        # Keep the GUI responsive while the cancelled threads shut down concurrently
+        deadline.start(timeout_ms)
+        while deadline.isActive() and any(not thread.isFinished() for _, thread in running):
+            loop.exec()
+        deadline.stop()
+        
+        for thread_name, thread in running:
+            try:
+                thread.finished.disconnect(loop.quit)
+            except (RuntimeError, TypeError):
+                pass  # Ignore errors if already disconnected
+            if thread.isRunning():
+                debug_print("DEBUG: Terminating %s", thread_name)
+                thread.terminate()
+                thread.wait(500)
+
     def cancel_installation(self):
         """Cancel the currently running installation"""
         reply = MessageService.question(
@@ -2624,31 +2895,7 @@ class InstallModlistScreen(QWidget):
         if reply == QMessageBox.Yes:
             self._safe_append_text("\n🛑 Cancelling installation...")
             
-            # Cancel the installation thread if it exists
-            if hasattr(self, 'install_thread') and self.install_thread.isRunning():
-                self.install_thread.cancel()
-                self.install_thread.wait(3000)  # Wait up to 3 seconds for graceful shutdown
-                if self.install_thread.isRunning():
-                    self.install_thread.terminate()  # Force terminate if needed
-                    self.install_thread.wait(1000)
-            
-            # Cancel the automated prefix thread if it exists
-            if hasattr(self, 'prefix_thread') and self.prefix_thread.isRunning():
-                self.prefix_thread.terminate()
-                self.prefix_thread.wait(3000)  # Wait up to 3 seconds for graceful shutdown
-                if self.prefix_thread.isRunning():
-                    self.prefix_thread.terminate()  # Force terminate if needed
-                    self.prefix_thread.wait(1000)
-            
-            # Cancel the configuration thread if it exists
-            if hasattr(self, 'config_thread') and self.config_thread.isRunning():
-                self.config_thread.terminate()
-                self.config_thread.wait(3000)  # Wait up to 3 seconds for graceful shutdown
-                if self.config_thread.isRunning():
-                    self.config_thread.terminate()  # Force terminate if needed
-                    self.config_thread.wait(1000)
-            
-            # Cleanup any remaining processes
+            # Stop the installation, automated prefix, fetch and configuration threads
             self.cleanup_processes()
             
             # Reset button states and re-enable all controls
@@ -2660,8 +2907,6 @@ class InstallModlistScreen(QWidget):
 
     def _show_somnium_post_install_guidance(self):
         """Show guidance popup for Somnium post-installation steps"""
-        from ..widgets.message_service import MessageService
-        
         guidance_text = f"""<b>Somnium Post-Installation Required</b><br><br>
 Due to Somnium's non-standard folder structure, you need to manually update the binary paths in ModOrganizer:<br><br>
 <b>1.</b> Launch the Steam shortcut created for Somnium<br>
@@ -2695,8 +2940,8 @@ https://wiki.scenicroute.games/Somnium/1_Installation.html</i>"""
         self.game_type_btn.setText("Please Select...")
 
         # Clear console and process monitor
-        self.console.clear()
-        self.process_monitor.clear()
+        self._clear_console()
+        self._clear_process_monitor()
 
         # Reset tabs to first tab (Online)
         self.source_tabs.setCurrentIndex(0)
@@ -2716,4 +2961,5 @@ https://wiki.scenicroute.games/Somnium/1_Installation.html</i>"""
     def closeEvent(self, event):
         """Handle window close event - clean up processes"""
         self.cleanup_processes()
+        self._close_log_file()
         event.accept() 
\ No newline at end of file
@@ -1,38 +1,60 @@
 """
 GUI Utilities for Jackify Frontend
 """
+import html
 import re
 
+# Foreground colors for SGR codes 30-37 and 90-97, indexed by code offset
+_COLORS_30 = ('black', 'red', 'green', 'yellow', 'blue', 'magenta', 'cyan', 'white')
+_COLORS_90 = ('gray', 'lightcoral', 'lightgreen', 'khaki', 'lightblue', 'violet', 'lightcyan', 'white')
 ANSI_COLOR_MAP = {
-    '30': 'black', '31': 'red', '32': 'green', '33': 'yellow', '34': 'blue', '35': 'magenta', '36': 'cyan', '37': 'white',
-    '90': 'gray', '91': 'lightcoral', '92': 'lightgreen', '93': 'khaki', '94': 'lightblue', '95': 'violet', '96': 'lightcyan', '97': 'white'
+    **{str(30 + i): color for i, color in enumerate(_COLORS_30)},
+    **{str(90 + i): color for i, color in enumerate(_COLORS_90)},
 }
 ANSI_RE = re.compile(r'\x1b\[(\d+)(;\d+)?m')
+# SGR color codes and newlines in one pattern, so ansi_to_html makes a single pass
+TOKEN_RE = re.compile(r'\x1b\[(\d+)(?:;\d+)?m|\n')
+# Markup ansi_to_html emits, so its output can be turned back into plain text
+ANSI_HTML_RE = re.compile(r'<span style="color:[^"]*">|</span>|<br>')
 
 def ansi_to_html(text):
     """Convert ANSI color codes to HTML"""
-    result = ''
+    parts = []
+    append = parts.append
+    escape = html.escape
     last_end = 0
     color = None
-    for match in ANSI_RE.finditer(text):
+    for match in TOKEN_RE.finditer(text):
         start, end = match.span()
-        code = match.group(1)
         if start > last_end:
-            chunk = text[last_end:start]
+            chunk = escape(text[last_end:start], quote=False)
             if color:
-                result += f'<span style="color:{color}">{chunk}</span>'
+                append(f'<span style="color:{color}">{chunk}</span>')
             else:
-                result += chunk
-        if code == '0':
-            color = None
-        elif code in ANSI_COLOR_MAP:
-            color = ANSI_COLOR_MAP[code]
+                append(chunk)
+        code = match.group(1)
+        if code is None:
+            append('<br>')
+        else:
+            code = int(code)
+            if code == 0:
+                color = None
+            elif 30 <= code <= 37:
+                color = _COLORS_30[code - 30]
+            elif 90 <= code <= 97:
+                color = _COLORS_90[code - 90]
         last_end = end
     if last_end < len(text):
-        chunk = text[last_end:]
+        chunk = escape(text[last_end:], quote=False)
         if color:
-            result += f'<span style="color:{color}">{chunk}</span>'
+            append(f'<span style="color:{color}">{chunk}</span>')
         else:
-            result += chunk
-    result = result.replace('\n', '<br>')
-    return result 
\ No newline at end of file
+            append(chunk)
+    return ''.join(parts)
+
+def ansi_html_to_text(text):
+    """Convert ansi_to_html output back to plain text for plain-text widgets"""
+    if '<' not in text and '&' not in text:
+        return text
+    text = ANSI_HTML_RE.sub(lambda m: '\n' if m.group() == '<br>' else '', text)
+    return html.unescape(text)
@@ -5,6 +5,8 @@ This module provides a popup dialog to warn users when they're about to install
 a modlist for a game that doesn't support automated post-install configuration.
 """
 
+from functools import lru_cache
+
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
     QPushButton, QTextEdit, QFrame
@@ -13,6 +15,91 @@ from PySide6.QtCore import Qt, Signal
 from PySide6.QtGui import QFont, QPixmap, QIcon
 
 
+_MESSAGE_TEMPLATE = """<p><strong>You are about to install a modlist for {target}.</strong></p>
+
+<p>While any modlist can be downloaded with Jackify, the post-install configuration can only be automatically applied to:</p>
+
+<ul>
+<li><strong>Skyrim Special Edition</strong></li>
+<li><strong>Fallout 4</strong></li>
+<li><strong>Fallout New Vegas</strong></li>
+<li><strong>Oblivion</strong></li>
+<li><strong>Starfield</strong></li>
+<li><strong>Oblivion Remastered</strong></li>
+<li><strong>Enderal</strong></li>
+</ul>
+
+<p>For unsupported games, you will need to manually configure Steam shortcuts and other post-install steps.</p>
+
+<p><em>We are working to add more automated support in future releases!</em></p>
+
+<p>Click <strong>Continue</strong> to proceed with the modlist installation, or <strong>Cancel</strong> to go back.</p>"""
+
+
+# Dialog style sheet, parsed once per dialog and targeted at widgets by object name
+_DIALOG_QSS = """
+QDialog#unsupportedGameDialog {
+    background-color: #23272e;
+    color: #f8f9fa;
+}
+QDialog#unsupportedGameDialog QLabel {
+    color: #f8f9fa;
+}
+QDialog#unsupportedGameDialog QLabel#dialogWarningIcon {
+    color: #e67e22;
+}
+QDialog#unsupportedGameDialog QLabel#dialogTitle {
+    color: #3fd0ea;
+}
+QFrame#dialogSeparator {
+    background: #444;
+    max-height: 1px;
+}
+QTextEdit#dialogMessage {
+    background-color: #23272e;
+    color: #f8f9fa;
+    border: 1px solid #444;
+    border-radius: 6px;
+    padding: 12px;
+    font-size: 12px;
+    font-family: 'Segoe UI', Arial, sans-serif;
+}
+QPushButton#dialogPrimary {
+    background-color: #3fd0ea;
+    color: #23272e;
+    border: none;
+    border-radius: 5px;
+    font-weight: bold;
+}
+QPushButton#dialogPrimary:hover {
+    background-color: #2bb8d6;
+}
+QPushButton#dialogPrimary:pressed {
+    background-color: #1a7e99;
+}
+QPushButton#dialogSecondary {
+    background-color: #6c757d;
+    color: white;
+    border: none;
+    border-radius: 5px;
+    font-weight: bold;
+}
+QPushButton#dialogSecondary:hover {
+    background-color: #5a6268;
+}
+QPushButton#dialogSecondary:pressed {
+    background-color: #545b62;
+}
+"""
+
+
+@lru_cache(maxsize=8)
+def _render_message(game_name: str = None) -> str:
+    """Render the notice HTML for a game name (or a generic unsupported game)."""
+    target = f"<em>{game_name}</em>" if game_name else "an unsupported game"
+    return _MESSAGE_TEMPLATE.format(target=target)
+
+
 class UnsupportedGameDialog(QDialog):
     """
     Dialog to warn users about unsupported games for post-install configuration.
@@ -24,6 +111,10 @@ class UnsupportedGameDialog(QDialog):
     # Signal emitted when user clicks OK to continue
     continue_installation = Signal()
     
+    # Shared fonts, created on first use (QFont needs a QApplication)
+    _ICON_FONT = None
+    _TITLE_FONT = None
+    
     def __init__(self, parent=None, game_name: str = None):
         super().__init__(parent)
         self.game_name = game_name
@@ -32,10 +123,16 @@ class UnsupportedGameDialog(QDialog):
     
     def setup_ui(self):
         """Set up the dialog UI."""
+        self.setObjectName("unsupportedGameDialog")
+        self.setStyleSheet(_DIALOG_QSS)
         self.setWindowTitle("Game Support Notice")
         self.setModal(True)
         self.setFixedSize(500, 500)
         
+        if UnsupportedGameDialog._ICON_FONT is None:
+            UnsupportedGameDialog._ICON_FONT = QFont("Arial", 18, QFont.Weight.Bold)
+            UnsupportedGameDialog._TITLE_FONT = QFont("Arial", 11, QFont.Weight.Bold)
+        
         # Main layout
         layout = QVBoxLayout()
         layout.setSpacing(20)
@@ -44,14 +141,14 @@ class UnsupportedGameDialog(QDialog):
         # Icon and title (smaller, less vertical space)
         title_layout = QHBoxLayout()
         icon_label = QLabel("!")
-        icon_label.setFont(QFont("Arial", 18, QFont.Weight.Bold))
+        icon_label.setFont(UnsupportedGameDialog._ICON_FONT)
         icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         icon_label.setFixedSize(32, 32)
-        icon_label.setStyleSheet("color: #e67e22;")
+        icon_label.setObjectName("dialogWarningIcon")
         title_layout.addWidget(icon_label)
         title_label = QLabel("<b>Game Support Notice</b>")
-        title_label.setFont(QFont("Arial", 11, QFont.Weight.Bold))
-        title_label.setStyleSheet("color: #3fd0ea;")
+        title_label.setFont(UnsupportedGameDialog._TITLE_FONT)
+        title_label.setObjectName("dialogTitle")
         title_layout.addWidget(title_label)
         title_layout.addStretch()
         layout.addLayout(title_layout)
@@ -61,7 +158,7 @@ class UnsupportedGameDialog(QDialog):
         separator = QFrame()
         separator.setFrameShape(QFrame.Shape.HLine)
         separator.setFrameShadow(QFrame.Shadow.Sunken)
-        separator.setStyleSheet("background: #444; max-height: 1px;")
+        separator.setObjectName("dialogSeparator")
         layout.addWidget(separator)
         # Reduce space after separator
         layout.addSpacing(4)
@@ -69,61 +166,9 @@ class UnsupportedGameDialog(QDialog):
         message_text = QTextEdit()
         message_text.setReadOnly(True)
         message_text.setMaximumHeight(340)
-        message_text.setStyleSheet("""
-            QTextEdit {
-                background-color: #23272e;
-                color: #f8f9fa;
-                border: 1px solid #444;
-                border-radius: 6px;
-                padding: 12px;
-                font-size: 12px;
-                font-family: 'Segoe UI', Arial, sans-serif;
-            }
-        """)
-        
-        # Create the message content
-        if self.game_name:
-            message = f"""<p><strong>You are about to install a modlist for <em>{self.game_name}</em>.</strong></p>
-
-<p>While any modlist can be downloaded with Jackify, the post-install configuration can only be automatically applied to:</p>
-
-<ul>
-<li><strong>Skyrim Special Edition</strong></li>
-<li><strong>Fallout 4</strong></li>
-<li><strong>Fallout New Vegas</strong></li>
-<li><strong>Oblivion</strong></li>
-<li><strong>Starfield</strong></li>
-<li><strong>Oblivion Remastered</strong></li>
-<li><strong>Enderal</strong></li>
-</ul>
-
-<p>For unsupported games, you will need to manually configure Steam shortcuts and other post-install steps.</p>
-
-<p><em>We are working to add more automated support in future releases!</em></p>
-
-<p>Click <strong>Continue</strong> to proceed with the modlist installation, or <strong>Cancel</strong> to go back.</p>"""
-        else:
-            message = f"""<p><strong>You are about to install a modlist for an unsupported game.</strong></p>
-
-<p>While any modlist can be downloaded with Jackify, the post-install configuration can only be automatically applied to:</p>
-
-<ul>
-<li><strong>Skyrim Special Edition</strong></li>
-<li><strong>Fallout 4</strong></li>
-<li><strong>Fallout New Vegas</strong></li>
-<li><strong>Oblivion</strong></li>
-<li><strong>Starfield</strong></li>
-<li><strong>Oblivion Remastered</strong></li>
-<li><strong>Enderal</strong></li>
-</ul>
-
-<p>For unsupported games, you will need to manually configure Steam shortcuts and other post-install steps.</p>
-
-<p><em>We are working to add more automated support in future releases!</em></p>
-
-<p>Click <strong>Continue</strong> to proceed with the modlist installation, or <strong>Cancel</strong> to go back.</p>"""
+        message_text.setObjectName("dialogMessage")
         
-        message_text.setHtml(message)
+        message_text.setHtml(_render_message(self.game_name))
         layout.addWidget(message_text)
         
         # Button layout (Continue left, Cancel right)
@@ -132,53 +177,16 @@ class UnsupportedGameDialog(QDialog):
         continue_button = QPushButton("Continue")
         continue_button.setFixedSize(100, 35)
         continue_button.setDefault(True)
-        continue_button.setStyleSheet("""
-            QPushButton {
-                background-color: #3fd0ea;
-                color: #23272e;
-                border: none;
-                border-radius: 5px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #2bb8d6;
-            }
-            QPushButton:pressed {
-                background-color: #1a7e99;
-            }
-        """)
+        continue_button.setObjectName("dialogPrimary")
         button_layout.addWidget(continue_button)
         cancel_button = QPushButton("Cancel")
         cancel_button.setFixedSize(100, 35)
-        cancel_button.setStyleSheet("""
-            QPushButton {
-                background-color: #6c757d;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #5a6268;
-            }
-            QPushButton:pressed {
-                background-color: #545b62;
-            }
-        """)
+        cancel_button.setObjectName("dialogSecondary")
         button_layout.addWidget(cancel_button)
         layout.addLayout(button_layout)
         self.setLayout(layout)
         self.cancel_button = cancel_button
         self.continue_button = continue_button
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #23272e;
-                color: #f8f9fa;
-            }
-            QLabel {
-                color: #f8f9fa;
-            }
-        """)
     
     def setup_connections(self):
         """Set up signal connections."""
@@ -7,9 +7,13 @@ and getting the path to the current AppImage file.
 
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+# Set by the AppImage runtime before launch and never changed while running
+_APPIMAGE_ENV = os.environ.get('APPIMAGE')
+
 
 def is_appimage() -> bool:
     """
@@ -18,9 +22,10 @@ def is_appimage() -> bool:
     Returns:
         bool: True if running as AppImage, False otherwise
     """
-    return 'APPIMAGE' in os.environ
+    return _APPIMAGE_ENV is not None
 
 
+@lru_cache(maxsize=1)
 def get_appimage_path() -> Optional[Path]:
     """
     Get the path to the current AppImage file.
@@ -31,15 +36,13 @@ def get_appimage_path() -> Optional[Path]:
     For security, this validates that the AppImage is actually Jackify to prevent
     accidentally updating other AppImages when running from development environments.
     
+    The result is cached, as the AppImage runtime environment doesn't change while running.
+    
     Returns:
         Optional[Path]: Path to the AppImage file if running as Jackify AppImage, None otherwise
     """
-    if not is_appimage():
-        return None
-    
-    appimage_path = os.environ.get('APPIMAGE')
-    if appimage_path and os.path.exists(appimage_path):
-        path = Path(appimage_path)
+    if _APPIMAGE_ENV and os.path.exists(_APPIMAGE_ENV):
+        path = Path(_APPIMAGE_ENV)
         
         # Validate this is actually a Jackify AppImage to prevent updating wrong apps
         if 'jackify' in path.name.lower():
@@ -81,17 +84,18 @@ def get_appimage_info() -> dict:
     info = {
         'is_appimage': is_appimage(),
         'path': appimage_path,
-        'can_update': can_self_update(),
+        'can_update': False,
         'size_mb': None,
         'writable': False
     }
     
-    if appimage_path and appimage_path.exists():
+    if appimage_path:
+        # One stat and one access check cover size, writability and can_update
         try:
             stat = appimage_path.stat()
             info['size_mb'] = round(stat.st_size / (1024 * 1024), 1)
-            info['writable'] = os.access(appimage_path, os.W_OK)
+            info['writable'] = info['can_update'] = os.access(appimage_path, os.W_OK)
         except (OSError, PermissionError):
             pass
     
-    return info
\ No newline at end of file
+    return info
@@ -6,10 +6,12 @@ supporting configurable data directory while keeping config in a fixed location.
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 
+@lru_cache(maxsize=1)
 def get_jackify_data_dir() -> Path:
     """
     Get the configurable Jackify data directory.
@@ -19,6 +21,8 @@ def get_jackify_data_dir() -> Path:
     - logs/ 
     - temporary proton prefixes during installation
     
+    The result is cached; call invalidate_path_cache() after changing jackify_data_dir.
+    
     Returns:
         Path: The Jackify data directory (always set in config)
     """
@@ -40,16 +44,19 @@ def get_jackify_data_dir() -> Path:
         return Path.home() / "Jackify"
 
 
+@lru_cache(maxsize=1)
 def get_jackify_logs_dir() -> Path:
     """Get the logs directory within the Jackify data directory."""
     return get_jackify_data_dir() / "logs"
 
 
+@lru_cache(maxsize=1)
 def get_jackify_downloads_dir() -> Path:
     """Get the downloaded modlists directory within the Jackify data directory."""
     return get_jackify_data_dir() / "downloaded_mod_lists"
 
 
+@lru_cache(maxsize=1)
 def get_jackify_config_dir() -> Path:
     """
     Get the Jackify configuration directory (always ~/.config/jackify).
@@ -62,4 +69,11 @@ def get_jackify_config_dir() -> Path:
     Returns:
         Path: Always ~/.config/jackify
     """
-    return Path.home() / ".config" / "jackify"
\ No newline at end of file
+    return Path.home() / ".config" / "jackify"
+
+
+def invalidate_path_cache() -> None:
+    """Forget cached directory paths, e.g. after jackify_data_dir changes in settings."""
+    for func in (get_jackify_data_dir, get_jackify_logs_dir,
+                 get_jackify_downloads_dir, get_jackify_config_dir):
+        func.cache_clear()
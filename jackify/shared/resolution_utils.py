@@ -7,10 +7,13 @@ Provides utility functions for handling resolution across GUI and CLI frontends
 
 import logging
 import os
+from functools import lru_cache
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+_STEAM_DECK_SUFFIX = ' (Steam Deck)'
+
 
 def get_default_resolution() -> str:
     """
@@ -46,9 +49,10 @@ def get_default_resolution() -> str:
     return "1920x1080"
 
 
+@lru_cache(maxsize=1)
 def _is_steam_deck() -> bool:
     """
-    Detect if running on Steam Deck
+    Detect if running on Steam Deck (cached, /etc/os-release is read once)
     
     Returns:
         bool: True if Steam Deck detected
@@ -93,21 +97,17 @@ def _validate_resolution_format(resolution: str) -> bool:
     Returns:
         bool: True if valid WxH format
     """
-    import re
-    
     if not resolution:
         return False
         
     # Handle Steam Deck format
-    clean_resolution = resolution.replace(' (Steam Deck)', '')
+    clean_resolution = resolution
+    if clean_resolution.endswith(_STEAM_DECK_SUFFIX):
+        clean_resolution = clean_resolution[:-len(_STEAM_DECK_SUFFIX)]
     
-    # Check WxH format
-    if re.match(r'^[0-9]+x[0-9]+$', clean_resolution):
-        try:
-            width, height = clean_resolution.split('x')
-            width_int, height_int = int(width), int(height)
-            return 0 < width_int <= 10000 and 0 < height_int <= 10000
-        except ValueError:
-            return False
-    
-    return False
\ No newline at end of file
+    # Check WxH format (ASCII digits only on both sides)
+    width, _, height = clean_resolution.partition('x')
+    if not (width.isascii() and height.isascii() and width.isdigit() and height.isdigit()):
+        return False
+    width_int, height_int = int(width), int(height)
+    return 0 < width_int <= 10000 and 0 < height_int <= 10000
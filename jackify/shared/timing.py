@@ -4,10 +4,19 @@ Simple shared timing for consistent progress timestamps across all Jackify servi
 import time
 import re
 
+# jackify-engine timestamp like [00:00:31]
+_TIMESTAMP_RE = re.compile(r'\[(\d{2}):(\d{2}):(\d{2})\]')
+# Characters at the end of the console output searched before a full scan
+_TAIL_WINDOW = 2048
+
 # Global state for shared timing
 _start_time = None
 _base_offset = 0
 
+# Last formatted timestamp, reused while the elapsed second is unchanged
+_cached_second = -1
+_cached_str = ""
+
 def initialize_from_console_output(console_text: str = None):
     """Initialize timing, optionally continuing from jackify-engine output"""
     global _start_time, _base_offset
@@ -16,12 +25,16 @@ def initialize_from_console_output(console_text: str = None):
         return  # Already initialized
     
     if console_text:
-        # Parse last timestamp from jackify-engine
-        timestamp_pattern = r'\[(\d{2}):(\d{2}):(\d{2})\]'
-        matches = list(re.finditer(timestamp_pattern, console_text))
+        # Parse last timestamp from jackify-engine. It is almost always near
+        # the end of the buffer, so scan a short tail before the full text.
+        last_match = None
+        for match in _TIMESTAMP_RE.finditer(console_text[-_TAIL_WINDOW:]):
+            last_match = match
+        if last_match is None and len(console_text) > _TAIL_WINDOW:
+            for match in _TIMESTAMP_RE.finditer(console_text):
+                last_match = match
         
-        if matches:
-            last_match = matches[-1]
+        if last_match:
             hours = int(last_match.group(1))
             minutes = int(last_match.group(2))
             seconds = int(last_match.group(3))
@@ -34,8 +47,7 @@ def continue_from_timestamp(timestamp_str: str):
     global _start_time, _base_offset
     
     # Parse timestamp like [00:00:31]
-    timestamp_pattern = r'\[(\d{2}):(\d{2}):(\d{2})\]'
-    match = re.match(timestamp_pattern, timestamp_str)
+    match = _TIMESTAMP_RE.match(timestamp_str)
     
     if match:
         hours = int(match.group(1))
@@ -63,19 +75,23 @@ def set_base_offset_from_installation_end():
 
 def get_timestamp():
     """Get current timestamp in [HH:MM:SS] format"""
-    global _start_time, _base_offset
+    global _start_time, _base_offset, _cached_second, _cached_str
     
     if _start_time is None:
         initialize_from_console_output()
     
     elapsed = int(time.time() - _start_time)
     total_seconds = _base_offset + elapsed
+    if total_seconds == _cached_second:
+        return _cached_str
     
     hours = total_seconds // 3600
     minutes = (total_seconds % 3600) // 60
     seconds = total_seconds % 60
     
-    return f"[{hours:02d}:{minutes:02d}:{seconds:02d}]"
+    _cached_str = f"[{hours:02d}:{minutes:02d}:{seconds:02d}]"
+    _cached_second = total_seconds
+    return _cached_str
 
 def reset():
     """Reset timing (for testing)"""